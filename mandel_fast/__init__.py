@@ -1,3 +1,3 @@
-from .core import py_mandelbrot, rs_mandelbrot, rs_mandelbrot_parallel, np_mandelbrot
+from .core import py_mandelbrot, rs_mandelbrot, rs_mandelbrot_parallel, rs_mandelbrot_aa, np_mandelbrot, RenderStats
 
-__all__ = ["py_mandelbrot", "rs_mandelbrot", "rs_mandelbrot_parallel", "np_mandelbrot"]
+__all__ = ["py_mandelbrot", "rs_mandelbrot", "rs_mandelbrot_parallel", "rs_mandelbrot_aa", "np_mandelbrot", "RenderStats"]
@@ -0,0 +1,22 @@
+from .workloads import WORKLOADS, Workload
+from .suite import (
+    ENGINES,
+    BenchResult,
+    Comparison,
+    append_history,
+    compare_runs,
+    load_history,
+    run_suite,
+)
+
+__all__ = [
+    "WORKLOADS",
+    "Workload",
+    "ENGINES",
+    "BenchResult",
+    "Comparison",
+    "append_history",
+    "compare_runs",
+    "load_history",
+    "run_suite",
+]
@@ -0,0 +1,358 @@
+import json
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from mandel_fast import (
+    np_mandelbrot,
+    py_mandelbrot,
+    rs_mandelbrot,
+    rs_mandelbrot_parallel,
+)
+from mandel_fast.core.rust_impl import SCHEDULES
+from mandel_fast.bench.workloads import WORKLOADS, Workload
+
+ENGINES = {
+    "python": py_mandelbrot,
+    "numpy": np_mandelbrot,
+    "rust": rs_mandelbrot,
+    "rust_parallel": rs_mandelbrot_parallel,
+}
+
+
+@dataclass
+class Throughput:
+    median: float
+    ci_low: float
+    ci_high: float
+
+
+@dataclass
+class BenchResult:
+    workload: str
+    engine: str
+    threads: int
+    max_iter: int
+    width: int
+    height: int
+    times: list[float]
+    pixels_per_sec: Throughput
+    iterations_per_sec: Throughput
+    efficiency: Throughput | None = None  # Only for rust_parallel with threads > 1
+    tile_size: int | None = None  # Only for rust_parallel, None is the engine default
+    schedule: str = "tiles"  # Only meaningful for rust_parallel
+
+    @property
+    def key(self) -> tuple:
+        return (
+            self.workload,
+            self.engine,
+            self.threads,
+            self.max_iter,
+            self.width,
+            self.height,
+            self.tile_size,
+            self.schedule,
+        )
+
+
+@dataclass
+class Comparison:
+    key: tuple
+    baseline: float  # Median pixels/sec
+    current: float
+    change: float  # Relative change, negative means slower
+
+
+def _time_fn(fn, repeats: int, warmup: int = 1) -> list[float]:
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        res = fn()
+        # use result to avoid any "oops it got optimized away" kind of issues
+        _ = int(res[0, 0])
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def _bootstrap_medians(
+    times: list[float], rng: np.random.Generator, n_resamples: int
+) -> np.ndarray:
+    samples = np.asarray(times, dtype=np.float64)
+    idx = rng.integers(0, len(samples), size=(n_resamples, len(samples)))
+    return np.median(samples[idx], axis=1)
+
+
+def _throughput(
+    work: float, medians: np.ndarray, times: list[float], confidence: float
+) -> Throughput:
+    alpha = (1.0 - confidence) / 2.0
+    rates = work / medians
+    return Throughput(
+        median=float(work / np.median(times)),
+        ci_low=float(np.quantile(rates, alpha)),
+        ci_high=float(np.quantile(rates, 1.0 - alpha)),
+    )
+
+
+def _total_iterations(
+    workload: Workload, width: int, height: int, max_iter: int
+) -> int:
+    # The Rust engines clamp their output to 255, so take the exact count from
+    # the statistics collected by the worker threads instead.
+    _, stats = rs_mandelbrot_parallel(
+        width, height, max_iter, *workload.extent, return_stats=True
+    )
+    return stats.total_iterations
+
+
+def run_suite(
+    workloads: list[str],
+    engines: list[str],
+    threads: list[int],
+    max_iters: list[int],
+    tile_sizes: list[int | None] = (None,),
+    schedules: list[str] = ("tiles",),
+    width: int = 400,
+    height: int = 400,
+    repeats: int = 5,
+    confidence: float = 0.95,
+    n_resamples: int = 2000,
+    seed: int = 0,
+    progress=None,
+) -> list[BenchResult]:
+    """
+    Time every combination of workload, engine, thread count and max_iter.
+
+    Parameters
+    ----------
+    workloads : list[str]
+        Names of workloads from ``WORKLOADS``.
+    engines : list[str]
+        Names of engines from ``ENGINES``.
+    threads : list[int]
+        Thread counts to sweep. Only used by the ``rust_parallel`` engine, the
+        other engines are always run once with ``threads=1``.
+    max_iters : list[int]
+        Values of ``max_iter`` to sweep.
+    tile_sizes : list[int | None], optional
+        Tile sizes to sweep for the ``rust_parallel`` engine. Default is the
+        engine default only.
+    schedules : list[str], optional
+        Task schedules to sweep for the ``rust_parallel`` engine, from
+        ``SCHEDULES``. Row schedules ignore the tile size and are run once.
+        Default is "tiles" only.
+    width : int, optional
+        Width of the rendered image in pixels. Default is 400.
+    height : int, optional
+        Height of the rendered image in pixels. Default is 400.
+    repeats : int, optional
+        Number of timed repetitions per combination. Default is 5.
+    confidence : float, optional
+        Confidence level of the bootstrapped intervals. Default is 0.95.
+    n_resamples : int, optional
+        Number of bootstrap resamples. Default is 2000.
+    seed : int, optional
+        Seed for the bootstrap resampling. Default is 0.
+    progress : callable, optional
+        Called with a short description before each combination is timed.
+
+    Returns
+    -------
+    list[BenchResult]
+        One result per combination. Parallel efficiency is computed relative to
+        the ``threads=1`` run of the same workload, max_iter, tile size and
+        schedule, if present.
+    """
+    unknown = set(schedules) - set(SCHEDULES)
+    if unknown:
+        raise ValueError(f"Unknown schedules {sorted(unknown)}, expected some of {SCHEDULES}")
+    rng = np.random.default_rng(seed)
+    pixels = width * height
+    results = []
+
+    for name in workloads:
+        workload = WORKLOADS[name]
+        for max_iter in max_iters:
+            iterations = _total_iterations(workload, width, height, max_iter)
+            serial_medians = {}
+
+            for engine in engines:
+                fn = ENGINES[engine]
+                if engine == "rust_parallel":
+                    variants = [
+                        (tile_size, schedule, n)
+                        for schedule in schedules
+                        for tile_size in (
+                            [None] if schedule.startswith("rows") else tile_sizes
+                        )
+                        for n in sorted(set(threads))
+                    ]
+                else:
+                    variants = [(None, "tiles", 1)]
+
+                for tile_size, schedule, n in variants:
+                    if progress is not None:
+                        desc = f"{name} {engine} threads={n} max_iter={max_iter}"
+                        if tile_size is not None:
+                            desc += f" tile_size={tile_size}"
+                        if engine == "rust_parallel":
+                            desc += f" schedule={schedule}"
+                        progress(desc)
+
+                    kwargs = {}
+                    if engine == "rust_parallel":
+                        kwargs = {"threads": n, "tile_size": tile_size, "schedule": schedule}
+                    times = _time_fn(
+                        lambda: fn(width, height, max_iter, *workload.extent, **kwargs),
+                        repeats=repeats,
+                    )
+                    medians = _bootstrap_medians(times, rng, n_resamples)
+
+                    efficiency = None
+                    if engine == "rust_parallel":
+                        if n == 1:
+                            serial_medians[tile_size, schedule] = (medians, times)
+                        elif (tile_size, schedule) in serial_medians:
+                            serial_boot, serial_times = serial_medians[tile_size, schedule]
+                            alpha = (1.0 - confidence) / 2.0
+                            eff = serial_boot / medians / n
+                            efficiency = Throughput(
+                                median=float(np.median(serial_times) / np.median(times) / n),
+                                ci_low=float(np.quantile(eff, alpha)),
+                                ci_high=float(np.quantile(eff, 1.0 - alpha)),
+                            )
+
+                    results.append(
+                        BenchResult(
+                            workload=name,
+                            engine=engine,
+                            threads=n,
+                            max_iter=max_iter,
+                            width=width,
+                            height=height,
+                            times=times,
+                            pixels_per_sec=_throughput(pixels, medians, times, confidence),
+                            iterations_per_sec=_throughput(
+                                iterations, medians, times, confidence
+                            ),
+                            efficiency=efficiency,
+                            tile_size=tile_size,
+                            schedule=schedule,
+                        )
+                    )
+
+    return results
+
+
+def _result_from_dict(data: dict) -> BenchResult:
+    efficiency = data.get("efficiency")
+    return BenchResult(
+        workload=data["workload"],
+        engine=data["engine"],
+        threads=data["threads"],
+        max_iter=data["max_iter"],
+        width=data["width"],
+        height=data["height"],
+        times=data["times"],
+        pixels_per_sec=Throughput(**data["pixels_per_sec"]),
+        iterations_per_sec=Throughput(**data["iterations_per_sec"]),
+        efficiency=Throughput(**efficiency) if efficiency is not None else None,
+        tile_size=data.get("tile_size"),
+        schedule=data.get("schedule", "tiles"),
+    )
+
+
+def load_history(path: str | Path) -> list[dict]:
+    """
+    Load all runs from a benchmark history file.
+
+    Each run is a dict with the keys ``timestamp``, ``machine`` and ``results``,
+    where ``results`` is a list of ``BenchResult`` objects. A missing file is
+    treated as an empty history.
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+
+    with path.open() as f:
+        data = json.load(f)
+
+    runs = []
+    for run in data["runs"]:
+        run = dict(run)
+        run["results"] = [_result_from_dict(r) for r in run["results"]]
+        runs.append(run)
+    return runs
+
+
+def append_history(path: str | Path, results: list[BenchResult]) -> dict:
+    """
+    Append a run to a benchmark history file, creating the file if needed.
+
+    Returns the run as it was written.
+    """
+    path = Path(path)
+    if path.exists():
+        with path.open() as f:
+            data = json.load(f)
+    else:
+        data = {"runs": []}
+
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "results": [asdict(r) for r in results],
+    }
+    data["runs"].append(run)
+
+    with path.open("w") as f:
+        json.dump(data, f, indent=2)
+    return run
+
+
+def compare_runs(
+    baseline: list[BenchResult], current: list[BenchResult]
+) -> list[Comparison]:
+    """
+    Compare median pixels/sec of two runs for every combination present in both.
+
+    Parameters
+    ----------
+    baseline : list[BenchResult]
+        Results of the reference run.
+    current : list[BenchResult]
+        Results of the run being checked.
+
+    Returns
+    -------
+    list[Comparison]
+        One comparison per shared combination, in the order of ``current``.
+    """
+    baseline_by_key = {r.key: r for r in baseline}
+    comparisons = []
+    for result in current:
+        ref = baseline_by_key.get(result.key)
+        if ref is None:
+            continue
+        comparisons.append(
+            Comparison(
+                key=result.key,
+                baseline=ref.pixels_per_sec.median,
+                current=result.pixels_per_sec.median,
+                change=result.pixels_per_sec.median / ref.pixels_per_sec.median - 1.0,
+            )
+        )
+    return comparisons
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Workload:
+    name: str
+    extent: tuple[float, float, float, float]  # (xmin, xmax, ymin, ymax)
+    description: str
+
+
+_DEEP_ZOOM_CENTER = (
+    -0.743643887037158704752191506114774,
+    0.131825904205311970493132056385139,
+)
+_DEEP_ZOOM_HALF_WIDTH = 5e-9
+
+
+WORKLOADS: dict[str, Workload] = {
+    workload.name: workload
+    for workload in [
+        Workload(
+            name="full",
+            extent=(-2.0, 1.0, -1.5, 1.5),
+            description="The full set, mostly cheap exterior pixels.",
+        ),
+        Workload(
+            name="seahorse",
+            extent=(-0.7475, -0.7425, 0.105, 0.11),
+            description="Seahorse valley, dominated by pixels close to the boundary.",
+        ),
+        Workload(
+            name="interior",
+            extent=(-0.5, 0.0, -0.25, 0.25),
+            description="Inside the main cardioid, every pixel runs to max_iter.",
+        ),
+        Workload(
+            name="deep_zoom",
+            extent=(
+                _DEEP_ZOOM_CENTER[0] - _DEEP_ZOOM_HALF_WIDTH,
+                _DEEP_ZOOM_CENTER[0] + _DEEP_ZOOM_HALF_WIDTH,
+                _DEEP_ZOOM_CENTER[1] - _DEEP_ZOOM_HALF_WIDTH,
+                _DEEP_ZOOM_CENTER[1] + _DEEP_ZOOM_HALF_WIDTH,
+            ),
+            description="A 1e-8 wide window where escape counts approach 1000.",
+        ),
+    ]
+}
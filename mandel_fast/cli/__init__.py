@@ -1,2 +1,5 @@
 from .main import main
-from .render import render
\ No newline at end of file
+from .render import render
+from .bench import bench
+from .worker import worker
+from .batch import batch
\ No newline at end of file
@@ -0,0 +1,52 @@
+from .main import main
+import rich_click as click
+
+
+@main.command()
+@click.argument("manifest", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--log",
+    "-l",
+    "log_path",
+    type=click.Path(dir_okay=False),
+    default="batch_log.jsonl",
+    help="JSON lines file a result record is appended to for every job",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    "max_workers",
+    type=click.IntRange(min=1),
+    default=2,
+    help="Maximum number of jobs rendered at the same time",
+)
+@click.option(
+    "--memory-limit",
+    type=click.IntRange(min=1),
+    default=2048,
+    help="Approximate memory in MiB that running jobs may use together",
+)
+@click.option("--force", is_flag=True, help="Render every job even if its output is up to date")
+def batch(manifest: str, log_path: str, max_workers: int, memory_limit: int, force: bool):
+    """Render all jobs in a JSON lines manifest of RenderConfig fields and output paths."""
+    from collections import Counter
+    from mandel_fast.render.batch import load_jobs, run_batch
+
+    try:
+        jobs = load_jobs(manifest)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="MANIFEST")
+
+    records = run_batch(
+        jobs,
+        log_path,
+        max_workers=max_workers,
+        memory_limit=memory_limit * 1024**2,
+        force=force,
+    )
+
+    counts = Counter(record["status"] for record in records)
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+    print(f"Processed {len(records)} jobs: {summary}. Results logged to {log_path}")
+    if counts["failed"]:
+        raise SystemExit(1)
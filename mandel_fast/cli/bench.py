@@ -0,0 +1,188 @@
+import os
+
+from .main import main
+from mandel_fast.bench.workloads import WORKLOADS
+from mandel_fast.core.rust_impl import SCHEDULES
+import rich_click as click
+
+
+def _format_throughput(throughput) -> str:
+    if throughput is None:
+        return "-"
+    return (
+        f"{throughput.median:.3g} "
+        f"[{throughput.ci_low:.3g}, {throughput.ci_high:.3g}]"
+    )
+
+
+@main.command()
+@click.option(
+    "--workload",
+    "-W",
+    "workloads",
+    multiple=True,
+    type=click.Choice(list(WORKLOADS), case_sensitive=False),
+    default=list(WORKLOADS),
+    help="Workloads to run, can be given multiple times",
+)
+@click.option(
+    "--engine",
+    "-M",
+    "engines",
+    multiple=True,
+    type=click.Choice(["python", "numpy", "rust", "rust_parallel"], case_sensitive=False),
+    default=["rust", "rust_parallel"],
+    help="Engines to benchmark, can be given multiple times",
+)
+@click.option(
+    "--threads",
+    "-t",
+    multiple=True,
+    type=click.IntRange(min=1),
+    default=sorted({1, os.cpu_count() or 1}),
+    help="Thread counts for the rust_parallel engine, can be given multiple times",
+)
+@click.option(
+    "--max-iterations",
+    "-m",
+    "max_iters",
+    multiple=True,
+    type=click.IntRange(min=1, max=65535),
+    default=[255, 1024],
+    help="Values of max_iter to sweep, can be given multiple times",
+)
+@click.option(
+    "--tile-size",
+    "-T",
+    "tile_sizes",
+    multiple=True,
+    type=click.IntRange(min=1),
+    help="Tile sizes for the rust_parallel engine, can be given multiple times",
+)
+@click.option(
+    "--schedule",
+    "-S",
+    "schedules",
+    multiple=True,
+    type=click.Choice(list(SCHEDULES), case_sensitive=False),
+    default=["tiles"],
+    help="Task schedules for the rust_parallel engine, can be given multiple times",
+)
+@click.option("--width", "-w", type=int, default=400, help="Image width in pixels")
+@click.option("--height", "-h", type=int, default=400, help="Image height in pixels")
+@click.option(
+    "--repeats",
+    "-r",
+    type=click.IntRange(min=2),
+    default=5,
+    help="Timed repetitions per combination",
+)
+@click.option(
+    "--history",
+    "-H",
+    type=click.Path(dir_okay=False),
+    default="bench_history.json",
+    help="JSON file the results are appended to",
+)
+@click.option(
+    "--compare",
+    is_flag=True,
+    help="Fail if throughput dropped compared to the previous run on this machine in the history",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=0.1,
+    help="Allowed relative drop in pixels/sec before --compare fails",
+)
+def bench(
+    workloads: tuple[str, ...],
+    engines: tuple[str, ...],
+    threads: tuple[int, ...],
+    max_iters: tuple[int, ...],
+    tile_sizes: tuple[int, ...],
+    schedules: tuple[str, ...],
+    width: int,
+    height: int,
+    repeats: int,
+    history: str,
+    compare: bool,
+    threshold: float,
+):
+    """Benchmark the Mandelbrot engines on a matrix of workloads."""
+    from rich.console import Console
+    from rich.table import Table
+    from mandel_fast.bench import append_history, compare_runs, load_history, run_suite
+
+    console = Console()
+    previous_runs = load_history(history)
+
+    with console.status("Benchmarking...") as status:
+        results = run_suite(
+            workloads=list(workloads),
+            engines=list(engines),
+            threads=list(threads),
+            max_iters=list(max_iters),
+            tile_sizes=list(tile_sizes) or [None],
+            schedules=list(schedules),
+            width=width,
+            height=height,
+            repeats=repeats,
+            progress=lambda desc: status.update(f"Benchmarking {desc}"),
+        )
+
+    table = Table(title=f"Throughput ({width}x{height}, median [95% CI])")
+    for column in ["Workload", "Engine", "Threads", "Tile", "Schedule", "max_iter"]:
+        table.add_column(column)
+    for column in ["Pixels/s", "Iterations/s", "Efficiency"]:
+        table.add_column(column, justify="right")
+    for r in results:
+        table.add_row(
+            r.workload,
+            r.engine,
+            str(r.threads),
+            str(r.tile_size) if r.tile_size is not None else "-",
+            r.schedule if r.engine == "rust_parallel" else "-",
+            str(r.max_iter),
+            _format_throughput(r.pixels_per_sec),
+            _format_throughput(r.iterations_per_sec),
+            _format_throughput(r.efficiency),
+        )
+    console.print(table)
+
+    run = append_history(history, results)
+    console.print(f"Appended results to {history}")
+
+    if not compare:
+        return
+    # Throughput is only comparable between runs on the same machine
+    baseline = next(
+        (r for r in reversed(previous_runs) if r["machine"] == run["machine"]), None
+    )
+    if baseline is None:
+        console.print(
+            "[yellow]Warning[/yellow] No previous run on this machine to compare against."
+        )
+        return
+
+    comparisons = compare_runs(baseline["results"], results)
+    if not comparisons:
+        console.print(
+            f"[red]Error[/red] The previous run from {baseline['timestamp']} shares no "
+            "workload, engine, threads, tile size, schedule and max_iter combination with this run."
+        )
+        raise SystemExit(1)
+    regressions = [c for c in comparisons if c.change < -threshold]
+    for c in regressions:
+        workload, engine, n, max_iter, _, _, tile_size, schedule = c.key
+        console.print(
+            f"[red]Regression[/red] {workload} {engine} threads={n} "
+            f"tile_size={tile_size} schedule={schedule} max_iter={max_iter}: "
+            f"{c.baseline:.3g} -> {c.current:.3g} pixels/s "
+            f"({c.change:+.1%})"
+        )
+    if regressions:
+        raise SystemExit(1)
+    console.print(
+        f"No regressions beyond {threshold:.0%} in {len(comparisons)} comparisons."
+    )
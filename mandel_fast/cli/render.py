@@ -2,12 +2,24 @@ from .main import main
 import rich_click as click
 
 
+class MaxIterType(click.ParamType):
+    name = "integer|auto"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, int) or value == "auto":
+            return value
+        try:
+            return int(value)
+        except ValueError:
+            self.fail(f"{value!r} is neither an integer nor 'auto'", param, ctx)
+
+
 @main.command()
 @click.option(
     "--extent",
     "-e",
     nargs=4,
-    type=tuple[float, float, float, float],
+    type=float,
     default=[-2.0, 1.0, -1.5, 1.5],
     help="The extent of the complex plane to render: xmin xmax ymin ymax",
 )
@@ -28,9 +40,9 @@ import rich_click as click
 @click.option(
     "--max-iterations",
     "-m",
-    type=int,
+    type=MaxIterType(),
     default=255,
-    help="The maximum number of iterations for the Mandelbrot calculation",
+    help="The maximum number of iterations for the Mandelbrot calculation, or 'auto' to estimate it",
 )
 @click.option("--output", "-o", type=click.Path(), help="The output file path")
 @click.option(
@@ -39,39 +51,145 @@ import rich_click as click
     type=click.Choice(["python", "rust", "rust_parallel"], case_sensitive=False),
     default="rust_parallel",
 )
+@click.option(
+    "--tile-size",
+    "-T",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Tile side length in pixels for the rust_parallel method, not combinable with --samples",
+)
+@click.option(
+    "--samples",
+    "-s",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Anti-aliasing sub-samples per axis for pixels on the set boundary, 1 disables",
+)
+@click.option(
+    "--aa-threshold",
+    type=float,
+    default=2.0,
+    help="Escape count difference between neighbours that marks a boundary pixel",
+)
+@click.option(
+    "--workers",
+    default=None,
+    help="Comma separated host:port list of `mandel-fast worker` processes to render on",
+)
+@click.option(
+    "--stats-log",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write render statistics and phase timings to this JSON file",
+)
 def render(
     extent: tuple[float, float, float, float],
     width: int,
     height: int,
-    max_iterations: int,
+    max_iterations: int | str,
     output: str,
     method: str,
+    tile_size: int | None,
+    samples: int,
+    aa_threshold: float,
+    workers: str | None,
+    stats_log: str | None,
 ):
     """Render the Mandelbrot set."""
-    from mandel_fast import py_mandelbrot, rs_mandelbrot, rs_mandelbrot_parallel
+    import json
+    import time
+    import numpy as np
+    from mandel_fast import RenderStats
     from PIL import Image
+    from mandel_fast.render.render import RenderConfig, save_image, select_engine
+
+    config = RenderConfig(
+        width=width,
+        height=height,
+        extent=tuple(extent),
+        max_iter=max_iterations,
+        method=method,
+        tile_size=tile_size,
+        samples=samples,
+        aa_threshold=aa_threshold,
+    )
+    engine_stats = bool(stats_log) and method != "python"
+    try:
+        mandelbrot_func, kwargs = select_engine(config, return_stats=engine_stats)
+    except ValueError as e:
+        param_hint = "--tile-size" if tile_size is not None and method != "python" else "--samples"
+        raise click.BadParameter(str(e), param_hint=param_hint)
 
+    if workers:
+        from mandel_fast.render.distributed import parse_workers, render_distributed
 
-    if method == "python":
-        mandelbrot_func = py_mandelbrot
-    elif method == "rust":
-        mandelbrot_func = rs_mandelbrot
-    elif method == "rust_parallel":
-        mandelbrot_func = rs_mandelbrot_parallel
+        if method != "rust_parallel" or samples > 1:
+            raise click.BadParameter(
+                "Distributed rendering requires the rust_parallel method without anti-aliasing",
+                param_hint="--workers",
+            )
+        try:
+            addresses = parse_workers(workers)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--workers")
+
+    t_start = time.perf_counter()
+    requested_max_iter = max_iterations
+    if max_iterations == "auto":
+        from mandel_fast.render.auto_iter import estimate_max_iter
+
+        max_iterations = estimate_max_iter(tuple(extent))
+        print(f"Estimated max_iter: {max_iterations}")
+    t_estimate = time.perf_counter()
+
+    if workers:
+        counts = render_distributed(
+            width, height, max_iterations, extent, addresses, engine_tile_size=tile_size
+        )
+        # Statistics from the exact counts, the image is clamped like a local render
+        stats = RenderStats.from_counts(counts, max_iterations) if stats_log else None
+        image = np.minimum(counts, 255).astype(np.uint8)
     else:
-        raise ValueError(f"Unknown method: {method}")
-    
-    extent_dict = {
-        "xmin": extent[0],
-        "xmax": extent[1],
-        "ymin": extent[2],
-        "ymax": extent[3],
-    }
-    
-    image = mandelbrot_func(width=width, height=height, max_iter=max_iterations, **extent_dict)
+        result = mandelbrot_func(
+            width=width,
+            height=height,
+            xmin=extent[0],
+            xmax=extent[1],
+            ymin=extent[2],
+            ymax=extent[3],
+            max_iter=max_iterations,
+            **kwargs,
+        )
+        image, stats = result if engine_stats else (result, None)
+    t_compute = time.perf_counter()
+
+    if samples > 1:
+        # Round the averaged escape counts back to 8-bit grey levels
+        image = np.clip(np.rint(image), 0, 255).astype(np.uint8)
 
     output_name = output or f"mandelbrot_{method}_{width}x{height}.png"
 
-    img = Image.fromarray(image)
-    img.save(output_name)
-    print(f"Saved image to {output_name}")
\ No newline at end of file
+    save_image(Image.fromarray(image), output_name, config, extra={"max_iter": max_iterations})
+    print(f"Saved image to {output_name}")
+
+    if stats_log:
+        if stats is None:
+            stats = RenderStats.from_counts(image, max_iterations)
+        stats.max_iter = max_iterations
+        stats.timings = {
+            "estimate_max_iter": t_estimate - t_start,
+            "compute": t_compute - t_estimate,
+            "encode": time.perf_counter() - t_compute,
+        }
+        log = {
+            "output": output_name,
+            "method": method,
+            "width": width,
+            "height": height,
+            "max_iter": requested_max_iter,
+            "extent": list(extent),
+            "stats": stats.to_dict(),
+        }
+        with open(stats_log, "w") as f:
+            json.dump(log, f, indent=2)
+        print(f"Saved render statistics to {stats_log}")
\ No newline at end of file
@@ -0,0 +1,29 @@
+from .main import main
+import rich_click as click
+
+
+@main.command()
+@click.option(
+    "--host",
+    default="127.0.0.1",
+    help="Interface to listen on, use 0.0.0.0 to accept coordinators from other nodes",
+)
+@click.option("--port", "-p", type=int, default=5555, help="Port to listen on, 0 picks a free port")
+@click.option(
+    "--threads",
+    "-t",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Threads used to render each tile, defaults to all cores",
+)
+def worker(host: str, port: int, threads: int | None):
+    """Render tiles for a distributed `mandel-fast render --workers` coordinator."""
+    from mandel_fast.render.distributed import serve_worker
+
+    def ready(address):
+        print(f"Worker listening on {address[0]}:{address[1]}", flush=True)
+
+    try:
+        serve_worker(host, port, threads=threads, ready=ready)
+    except KeyboardInterrupt:
+        pass
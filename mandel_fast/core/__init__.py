@@ -1,5 +1,6 @@
 from .py_impl import py_mandelbrot
-from .rust_impl import rs_mandelbrot, rs_mandelbrot_parallel
+from .rust_impl import rs_mandelbrot, rs_mandelbrot_parallel, rs_mandelbrot_aa
 from .numpy_impl import np_mandelbrot
+from .stats import RenderStats
 
-__all__ = ["py_mandelbrot", "rs_mandelbrot", "rs_mandelbrot_parallel", "np_mandelbrot"]
+__all__ = ["py_mandelbrot", "rs_mandelbrot", "rs_mandelbrot_parallel", "rs_mandelbrot_aa", "np_mandelbrot", "RenderStats"]
@@ -1,8 +1,13 @@
 from ._rust import mandelbrot as _rs_mandelbrot
 from ._rust import mandelbrot_parallel as _rs_mandelbrot_parallel
+from ._rust import mandelbrot_aa as _rs_mandelbrot_aa
+from .stats import RenderStats
 
 import numpy as np
 
+# Task schedules of rs_mandelbrot_parallel, kept in sync with src/lib.rs
+SCHEDULES = ("tiles", "tiles_unordered", "rows", "rows_unordered")
+
 
 def rs_to_array(buf, width, height):
     # buf is a list/Vec[u8] returned via PyO3; turn into ndarray
@@ -10,6 +15,12 @@ def rs_to_array(buf, width, height):
     return arr
 
 
+def _to_counts(buf, width, height, exact):
+    if exact:
+        return np.asarray(buf, dtype=np.uint16).reshape((height, width))
+    return rs_to_array(buf, width, height)
+
+
 def rs_mandelbrot_parallel(
     width: int,
     height: int,
@@ -19,7 +30,13 @@ def rs_mandelbrot_parallel(
     ymin: float,
     ymax: float,
     threads: int | None = None,
-) -> np.ndarray:
+    return_stats: bool = False,
+    tile_size: int | None = None,
+    cost_hint: np.ndarray | None = None,
+    region: tuple[int, int, int, int] | None = None,
+    schedule: str = "tiles",
+    exact: bool = False,
+) -> np.ndarray | tuple[np.ndarray, RenderStats]:
     """
     Compute the Mandelbrot set using the Rust parallel implementation.
 
@@ -42,11 +59,49 @@ def rs_mandelbrot_parallel(
     threads : int | None, optional
         The number of threads to use for parallel computation. If None,
         the implementation will decide the optimal number of threads.
+    return_stats : bool, optional
+        If True, also return a RenderStats object collected by the worker
+        threads. Default is False.
+    tile_size : int | None, optional
+        Side length in pixels of the square tiles the image is split into.
+        If None, the implementation default of 64 is used.
+    cost_hint : np.ndarray | None, optional
+        Estimated cost of every tile, shape (tiles_y, tiles_x), used to start
+        the most expensive tiles first. Typically the ``tile_iterations`` of
+        the previous frame of an animation. If None, the cost is estimated
+        from a sparse probe of each tile.
+    region : tuple[int, int, int, int] | None, optional
+        Sub-rectangle (x0, y0, w, h) of the width x height image to compute.
+        The result has shape (h, w) and is identical to the same pixels of a
+        full render. If None, the whole image is computed.
+    schedule : str, optional
+        How the work is split into tasks, one of ``SCHEDULES``. "tiles" (the
+        default) starts the square tiles in order of decreasing estimated cost,
+        "rows" does the same with one task per image row. The "_unordered"
+        variants hand the tasks out in image order instead and ignore
+        ``cost_hint``. Row schedules ignore ``tile_size``.
+    exact : bool, optional
+        If True, return the exact escape counts as a uint16 array instead of
+        a uint8 array clamped to 255. Default is False.
     """
+    if cost_hint is not None:
+        cost_hint = np.asarray(cost_hint, dtype=np.float64).ravel().tolist()
+    out_width, out_height = (width, height) if region is None else region[2:]
+
+    if return_stats:
+        buf, raw = _rs_mandelbrot_parallel(
+            width, height, max_iter, xmin, xmax, ymin, ymax, threads,
+            stats=True, tile_size=tile_size, cost_hint=cost_hint, region=region,
+            schedule=schedule, exact=exact,
+        )
+        return _to_counts(buf, out_width, out_height, exact), RenderStats.from_raw(raw)
+
     buf = _rs_mandelbrot_parallel(
-        width, height, max_iter, xmin, xmax, ymin, ymax, threads
+        width, height, max_iter, xmin, xmax, ymin, ymax, threads,
+        tile_size=tile_size, cost_hint=cost_hint, region=region, schedule=schedule,
+        exact=exact,
     )
-    return rs_to_array(buf, width, height)
+    return _to_counts(buf, out_width, out_height, exact)
 
 
 def rs_mandelbrot(
@@ -57,7 +112,8 @@ def rs_mandelbrot(
     xmax: float,
     ymin: float,
     ymax: float,
-) -> np.ndarray:
+    return_stats: bool = False,
+) -> np.ndarray | tuple[np.ndarray, RenderStats]:
     """
     Compute the Mandelbrot set using the Rust single-threaded implementation.
 
@@ -77,7 +133,83 @@ def rs_mandelbrot(
         The minimum y-coordinate (imaginary part) of the complex plane.
     ymax : float
         The maximum y-coordinate (imaginary part) of the complex plane.
+    return_stats : bool, optional
+        If True, also return a RenderStats object. Default is False.
     """
+    if return_stats:
+        buf, raw = _rs_mandelbrot(
+            width, height, max_iter, xmin, xmax, ymin, ymax, stats=True
+        )
+        return rs_to_array(buf, width, height), RenderStats.from_raw(raw)
 
     buf = _rs_mandelbrot(width, height, max_iter, xmin, xmax, ymin, ymax)
     return rs_to_array(buf, width, height)
+
+
+def rs_mandelbrot_aa(
+    width: int,
+    height: int,
+    max_iter: int,
+    xmin: float,
+    xmax: float,
+    ymin: float,
+    ymax: float,
+    samples: int = 4,
+    threshold: float = 2.0,
+    threads: int | None = None,
+    return_stats: bool = False,
+) -> np.ndarray | tuple[np.ndarray, RenderStats]:
+    """
+    Compute an anti-aliased Mandelbrot set using adaptive supersampling in Rust.
+
+    The image is first computed at native resolution. Only pixels where one of
+    the 8 neighbours differs by more than ``threshold`` iterations are then
+    resampled on a ``samples`` x ``samples`` sub-pixel grid, so the cost scales
+    with the length of the boundary rather than the area of the image.
+
+    Parameters
+    ----------
+    width : int
+        The width of the output image in pixels.
+    height : int
+        The height of the output image in pixels.
+    max_iter : int
+        The maximum number of iterations to perform for each point.
+    xmin : float
+        The minimum x-coordinate (real part) of the complex plane.
+    xmax : float
+        The maximum x-coordinate (real part) of the complex plane.
+    ymin : float
+        The minimum y-coordinate (imaginary part) of the complex plane.
+    ymax : float
+        The maximum y-coordinate (imaginary part) of the complex plane.
+    samples : int, optional
+        Number of sub-pixel samples along each axis of a resampled pixel.
+        Default is 4.
+    threshold : float, optional
+        Difference in escape count between neighbouring pixels above which a
+        pixel is resampled. Default is 2.0.
+    threads : int | None, optional
+        The number of threads to use for parallel computation. If None,
+        the implementation will decide the optimal number of threads.
+    return_stats : bool, optional
+        If True, also return a RenderStats object. Default is False.
+
+    Returns
+    -------
+    np.ndarray
+        Float32 array of shape (height, width) with the average escape count
+        of every pixel.
+    """
+    if return_stats:
+        buf, raw = _rs_mandelbrot_aa(
+            width, height, max_iter, xmin, xmax, ymin, ymax,
+            samples, threshold, threads, stats=True,
+        )
+        arr = np.asarray(buf, dtype=np.float32).reshape((height, width))
+        return arr, RenderStats.from_raw(raw)
+
+    buf = _rs_mandelbrot_aa(
+        width, height, max_iter, xmin, xmax, ymin, ymax, samples, threshold, threads
+    )
+    return np.asarray(buf, dtype=np.float32).reshape((height, width))
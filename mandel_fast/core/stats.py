@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class RenderStats:
+    total_iterations: int
+    escaped: int
+    interior: int
+    row_iterations: np.ndarray  # Sum of escape counts per image row
+    tile_iterations: np.ndarray | None = None  # Per tile, shape (tiles_y, tiles_x)
+    thread_busy: list[float] = field(default_factory=list)  # Seconds per worker
+    supersampled: int = 0  # Pixels resampled by anti-aliasing
+    max_iter: int | None = None  # Iteration limit used, set by render_mandelbrot
+    timings: dict[str, float] = field(default_factory=dict)  # Wall-clock per phase
+
+    @property
+    def pixels(self) -> int:
+        return self.escaped + self.interior
+
+    @property
+    def interior_fraction(self) -> float:
+        return self.interior / self.pixels if self.pixels else 0.0
+
+    @classmethod
+    def from_raw(cls, raw) -> "RenderStats":
+        """Convert the statistics object returned by the Rust engines."""
+        return cls(
+            total_iterations=raw.total_iterations,
+            escaped=raw.escaped,
+            interior=raw.interior,
+            row_iterations=np.asarray(raw.row_iterations, dtype=np.uint64),
+            tile_iterations=(
+                np.asarray(raw.tile_iterations, dtype=np.uint64).reshape(
+                    raw.tiles_y, raw.tiles_x
+                )
+                if raw.tiles_x
+                else None
+            ),
+            thread_busy=list(raw.thread_busy),
+            supersampled=raw.supersampled,
+        )
+
+    @classmethod
+    def from_counts(cls, counts: np.ndarray, max_iter: int) -> "RenderStats":
+        """Compute statistics from an array of exact escape counts."""
+        interior = int(np.count_nonzero(counts == max_iter))
+        return cls(
+            total_iterations=int(counts.sum(dtype=np.uint64)),
+            escaped=counts.size - interior,
+            interior=interior,
+            row_iterations=counts.sum(axis=1, dtype=np.uint64),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "total_iterations": self.total_iterations,
+            "escaped": self.escaped,
+            "interior": self.interior,
+            "interior_fraction": self.interior_fraction,
+            "row_iterations": self.row_iterations.tolist(),
+            "tile_iterations": (
+                self.tile_iterations.tolist()
+                if self.tile_iterations is not None
+                else None
+            ),
+            "thread_busy": self.thread_busy,
+            "supersampled": self.supersampled,
+            "max_iter": self.max_iter,
+            "timings": self.timings,
+        }
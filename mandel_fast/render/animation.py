@@ -1,5 +1,22 @@
-from mandel_fast.render.render import RenderConfig
+from mandel_fast import RenderStats
+from mandel_fast.render.render import RenderConfig, render_mandelbrot
+from mandel_fast.render.video import is_video_path, open_video_writer
+from dataclasses import dataclass, field
+from rich.console import Console
 from rich.progress import track
+import time
+
+
+@dataclass
+class AnimationStats:
+    frames: list[RenderStats]
+    timings: dict[str, float] = field(default_factory=dict)  # Wall-clock per phase
+
+    def to_dict(self) -> dict:
+        return {
+            "timings": self.timings,
+            "frames": [frame.to_dict() for frame in self.frames],
+        }
 
 
 def _apply_easing(t: float, easing: str) -> float:
@@ -103,7 +120,11 @@ def interpolate_configs(
                 t_eased,
                 extent_mode,
             )
-            max_iter = int(start.max_iter + t_eased * (end.max_iter - start.max_iter))
+            if "auto" in (start.max_iter, end.max_iter):
+                # Estimated per frame from the frame's own extent
+                max_iter = "auto"
+            else:
+                max_iter = int(start.max_iter + t_eased * (end.max_iter - start.max_iter))
 
             new_config = RenderConfig(
                 width=width,
@@ -111,6 +132,9 @@ def interpolate_configs(
                 extent=(xmin, xmax, ymin, ymax),
                 max_iter=max_iter,
                 method=start.method,  # Assuming method remains the same
+                tile_size=start.tile_size,
+                samples=start.samples,
+                aa_threshold=start.aa_threshold,
             )
             interpolated_configs.append(new_config)
 
@@ -148,9 +172,15 @@ def make_animation(
     easing: str = "linear",
     extent_mode: str = "linear",    
     reverse: bool = False,
-) -> None:
+    return_stats: bool = False,
+) -> AnimationStats | None:
     """
-    Create an animated GIF by rendering frames based on interpolated RenderConfig objects.
+    Create an animation by rendering frames based on interpolated RenderConfig objects.
+
+    GIF output keeps all frames in memory until the end. Paths ending in
+    ``.y4m`` or ``.npy``, or "-" for YUV4MPEG2 on stdout, are streamed instead:
+    every frame is written as soon as it is rendered, so memory use does not
+    grow with the number of frames. All frames of a stream must have the same size.
 
     Parameters
     ----------
@@ -159,7 +189,7 @@ def make_animation(
     steps : list[int]
         A list of integers specifying the number of interpolation steps between each pair of configurations.
     output_path : str
-        The file path to save the animated GIF.
+        The file path to save the animation to, or "-" to stream it to stdout.
     fps : int, optional
         Frames per second for the animation. Default is 30.
     easing : str, optional
@@ -169,8 +199,14 @@ def make_animation(
         "log_zoom" makes zooming smoother by interpolating the extent sizes exponentially.
     reverse : bool, optional
         If True, the animation will play in reverse after reaching the end. Default is False.
+        Streamed animations render the frames of the way back again.
+    return_stats : bool, optional
+        If True, return an AnimationStats object with the RenderStats of every
+        frame and wall-clock timings of the "render" and "encode" phases.
+        Default is False.
     """
     frames = []
+    frame_stats = []
     interpolated_configs = interpolate_configs(
         configs,
         steps,
@@ -178,13 +214,76 @@ def make_animation(
         extent_mode=extent_mode,
     )
 
-    for cfg in track(
-        interpolated_configs,
-        description="Rendering frames...",
-        total=len(interpolated_configs),
-    ):
-        img = render_mandelbrot(cfg)
-        frames.append(img)
+    streaming = is_video_path(output_path)
+    writer = None
+    if streaming:
+        if reverse:
+            # Streamed frames are not kept, so the way back is rendered again
+            interpolated_configs += interpolated_configs[-2:0:-1]
+        if len({(cfg.width, cfg.height) for cfg in interpolated_configs}) != 1:
+            raise ValueError("All frames of a streamed animation must have the same size.")
+        writer = open_video_writer(
+            output_path,
+            len(interpolated_configs),
+            interpolated_configs[0].width,
+            interpolated_configs[0].height,
+            fps=fps,
+        )
+
+    t_start = time.perf_counter()
+    t_encode = 0.0
+    prev_cfg, prev_stats = None, None
+    try:
+        for cfg in track(
+            interpolated_configs,
+            description="Rendering frames...",
+            total=len(interpolated_configs),
+            # Keep the progress bar out of a video streamed to stdout
+            console=Console(stderr=True) if output_path == "-" else None,
+        ):
+            # Consecutive frames are similar, so the per-tile cost of the previous
+            # frame is a good schedule for the next one if the tile grid is unchanged.
+            cost_hint = None
+            if (
+                prev_stats is not None
+                and prev_stats.tile_iterations is not None
+                and (prev_cfg.width, prev_cfg.height, prev_cfg.tile_size)
+                == (cfg.width, cfg.height, cfg.tile_size)
+            ):
+                cost_hint = prev_stats.tile_iterations
+
+            # Only the tiled engine without anti-aliasing reports tile costs
+            if return_stats or (cfg.method == "rust_parallel" and cfg.samples == 1):
+                img, stats = render_mandelbrot(
+                    cfg, return_stats=True, cost_hint=cost_hint, as_array=streaming
+                )
+            else:
+                img = render_mandelbrot(cfg, as_array=streaming)
+                stats = None
+            if return_stats:
+                frame_stats.append(stats)
+            if streaming:
+                t_write = time.perf_counter()
+                writer.write(img)
+                t_encode += time.perf_counter() - t_write
+            else:
+                frames.append(img)
+            prev_cfg, prev_stats = cfg, stats
+    finally:
+        if writer is not None:
+            writer.close()
+    t_render = time.perf_counter()
+
+    if streaming:
+        if return_stats:
+            return AnimationStats(
+                frames=frame_stats,
+                timings={
+                    "render": t_render - t_start - t_encode,
+                    "encode": t_encode,
+                },
+            )
+        return None
 
     if reverse:
         frames += frames[-2:0:-1]  # Exclude the last frame to avoid duplication
@@ -197,10 +296,17 @@ def make_animation(
         loop=0,
     )
 
+    if return_stats:
+        return AnimationStats(
+            frames=frame_stats,
+            timings={
+                "render": t_render - t_start,
+                "encode": time.perf_counter() - t_render,
+            },
+        )
 
-if __name__ == "__main__":
-    from mandel_fast.render.render import render_mandelbrot
 
+if __name__ == "__main__":
     central_point = (
         -0.743643887037158704752191506114774,
         0.131825904205311970493132056385139,
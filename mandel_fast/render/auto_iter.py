@@ -0,0 +1,88 @@
+import math
+
+import numpy as np
+
+from mandel_fast import rs_mandelbrot_parallel
+
+# Width of the extent that shows the whole set, zoom depth is measured from here
+FULL_SET_WIDTH = 3.0
+# The engines count iterations in 16 bits
+MAX_ITER_LIMIT = 65535
+
+
+def _probe_counts(extent: tuple[float, float, float, float], probe_size: int, max_iter: int) -> np.ndarray:
+    xmin, xmax, ymin, ymax = extent
+    # Follow the aspect ratio, but at most probe_size pixels on either side
+    aspect = (ymax - ymin) / (xmax - xmin)
+    probe_width = max(1, min(probe_size, round(probe_size / aspect)))
+    probe_height = max(1, min(probe_size, round(probe_size * aspect)))
+    return rs_mandelbrot_parallel(probe_width, probe_height, max_iter, *extent, exact=True)
+
+
+def estimate_max_iter(
+    extent: tuple[float, float, float, float],
+    probe_size: int = 64,
+    tolerance: float = 1e-3,
+    min_iter: int = 64,
+    limit: int = MAX_ITER_LIMIT,
+) -> int:
+    """
+    Estimate the smallest max_iter that keeps the boundary detail of a view stable.
+
+    A low-resolution probe is rendered with twice an iteration budget chosen
+    from the zoom depth. While more than ``tolerance`` of the probe pixels
+    escape only in that extra doubling, i.e. would change from interior to
+    escaped, the budget is doubled and the probe repeated. Once
+    the budget is stable, pixels that do not escape within the probe are
+    taken to be interior. For candidate values n = min_iter, 2 * min_iter, ...
+    the fraction of probe pixels that escape within the probe but not within
+    n iterations is the fraction that max_iter = n would wrongly show as
+    interior. The smallest candidate for which this fraction is below
+    ``tolerance`` is returned.
+
+    Parameters
+    ----------
+    extent : tuple[float, float, float, float]
+        The extent of the complex plane: (xmin, xmax, ymin, ymax).
+    probe_size : int, optional
+        Size of the longer side of the probe in pixels, the shorter side
+        follows the extent's aspect ratio. Default is 64.
+    tolerance : float, optional
+        Largest acceptable fraction of pixels changed by one extra doubling.
+        Default is 1e-3.
+    min_iter : int, optional
+        Smallest value returned. Default is 64.
+    limit : int, optional
+        Largest value returned. Default is 65535.
+
+    Returns
+    -------
+    int
+        The estimated max_iter.
+    """
+    xmin, xmax, ymin, ymax = extent
+    if xmax <= xmin or ymax <= ymin:
+        raise ValueError("Extent sizes must be positive to estimate max_iter.")
+
+    # Deeper zooms need more iterations, roughly doubling every 16x of zoom,
+    # so start probing there rather than at min_iter.
+    depth = max(0.0, math.log2(FULL_SET_WIDTH / (xmax - xmin)))
+    budget = min(limit, 2 * min_iter * 2 ** int(depth / 4))
+
+    while True:
+        # Probing with one extra doubling shows the pixels the budget cuts off
+        probe_iter = min(limit, 2 * budget)
+        counts = _probe_counts(extent, probe_size, probe_iter)
+        escaped = counts < probe_iter
+        changed = np.count_nonzero(escaped & (counts >= budget))
+        if budget >= limit or changed / counts.size <= tolerance:
+            break
+        budget = min(limit, 2 * budget)
+
+    n = min_iter
+    while n < budget:
+        changed = np.count_nonzero(escaped & (counts >= n))
+        if changed / counts.size <= tolerance:
+            break
+        n *= 2
+    return min(n, limit)
@@ -0,0 +1,241 @@
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+from mandel_fast.render.render import (
+    METADATA_SIDECAR_SUFFIX,
+    RenderConfig,
+    config_hash,
+    read_metadata,
+    render_mandelbrot,
+    save_image,
+)
+
+# Rough peak memory per pixel while rendering and colourising an image:
+# uint8 counts, float32 normalised values, float64 RGBA colour map output,
+# float32 and uint8 RGB, plus the PIL image.
+BYTES_PER_PIXEL = 64
+
+
+@dataclass
+class BatchJob:
+    config: RenderConfig
+    output: str
+    line: int  # Line number in the manifest
+
+
+class _MemoryBudget:
+    """Blocks until enough of a fixed memory budget is free for a job."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, n: int) -> None:
+        with self._cond:
+            # A job larger than the whole budget may still run on its own
+            self._cond.wait_for(lambda: self.used == 0 or self.used + n <= self.limit)
+            self.used += n
+
+    def release(self, n: int) -> None:
+        with self._cond:
+            self.used -= n
+            self._cond.notify_all()
+
+
+def load_jobs(path: str | Path) -> list[BatchJob]:
+    """
+    Read a JSON lines manifest of render jobs.
+
+    Every non-empty line is an object with the fields of RenderConfig and an
+    ``output`` path. Relative output paths are resolved against the directory
+    of the manifest. If ``output`` is missing, the image is written to
+    ``mandelbrot_<hash>.png`` next to the manifest. Jobs with different
+    parameters that write to the same output are rejected with a ValueError.
+    """
+    path = Path(path)
+    names = {f.name for f in fields(RenderConfig)}
+    jobs = []
+    writers: dict[str, tuple[str, int]] = {}  # Output -> (parameter hash, line)
+    with path.open() as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no}: invalid JSON: {e}") from None
+            if not isinstance(data, dict):
+                raise ValueError(f"{path}:{line_no}: expected a JSON object")
+            output = data.pop("output", None)
+            unknown = set(data) - names
+            if unknown:
+                raise ValueError(
+                    f"{path}:{line_no}: unknown job fields {sorted(unknown)}"
+                )
+            try:
+                config = RenderConfig(**data)
+            except TypeError as e:
+                raise ValueError(f"{path}:{line_no}: {e}") from None
+            try:
+                extent = tuple(float(v) for v in config.extent)
+            except (TypeError, ValueError):
+                extent = ()
+            if len(extent) != 4:
+                raise ValueError(
+                    f"{path}:{line_no}: extent must be four numbers [xmin, xmax, ymin, ymax]"
+                )
+            config.extent = extent
+
+            params_hash = config_hash(config)
+            if output is None:
+                output = f"mandelbrot_{params_hash[:16]}.png"
+            output = os.path.normpath(path.parent / output)
+            other_hash, other_line = writers.setdefault(output, (params_hash, line_no))
+            if other_hash != params_hash:
+                raise ValueError(
+                    f"{path}:{line_no}: output {output} is also written by line "
+                    f"{other_line} with different parameters"
+                )
+            jobs.append(BatchJob(config=config, output=output, line=line_no))
+    return jobs
+
+
+def run_batch(
+    jobs: list[BatchJob],
+    log_path: str | Path,
+    max_workers: int = 2,
+    memory_limit: int = 2 * 1024**3,
+    force: bool = False,
+) -> list[dict]:
+    """
+    Render a list of jobs concurrently, skipping work that is already done.
+
+    Jobs with identical parameters are rendered once and the image is copied
+    to the other outputs, or encoded again if their format differs. Jobs whose
+    output already exists with a matching parameter hash in its metadata (see
+    save_image) are skipped.
+
+    Parameters
+    ----------
+    jobs : list[BatchJob]
+        The jobs to run, usually from load_jobs.
+    log_path : str | Path
+        JSON lines file that a result record is appended to for every job.
+    max_workers : int, optional
+        Maximum number of jobs rendered at the same time. Default is 2.
+    memory_limit : int, optional
+        Approximate number of bytes that running jobs may use together.
+        Default is 2 GiB.
+    force : bool, optional
+        If True, render every job even if its output is up to date.
+
+    Returns
+    -------
+    list[dict]
+        The result records, in the order of ``jobs``.
+    """
+    budget = _MemoryBudget(memory_limit)
+    log_lock = threading.Lock()
+    records: dict[int, dict] = {}
+
+    def log(index: int, record: dict) -> None:
+        records[index] = record
+        with log_lock, open(log_path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    # Collapse jobs with identical parameters, keeping the first as the one to render
+    groups: dict[str, list[int]] = {}
+    for index, job in enumerate(jobs):
+        groups.setdefault(config_hash(job.config), []).append(index)
+
+    def is_done(job: BatchJob, params_hash: str) -> bool:
+        if force or not Path(job.output).exists():
+            return False
+        metadata = read_metadata(job.output)
+        return metadata is not None and metadata.get("hash") == params_hash
+
+    def run_group(params_hash: str, indices: list[int]) -> None:
+        pending = []
+        for index in indices:
+            job = jobs[index]
+            if is_done(job, params_hash):
+                log(index, _record(job, params_hash, "skipped"))
+            elif any(jobs[i].output == job.output for i in pending):
+                log(index, _record(job, params_hash, "duplicate"))
+            else:
+                pending.append(index)
+        if not pending:
+            return
+
+        first = jobs[pending[0]]
+        cost = first.config.width * first.config.height * BYTES_PER_PIXEL
+        budget.acquire(cost)
+        try:
+            try:
+                t_start = time.perf_counter()
+                img, stats = render_mandelbrot(first.config, return_stats=True)
+                t_render = time.perf_counter()
+                extra = {"max_iter": stats.max_iter}
+                Path(first.output).parent.mkdir(parents=True, exist_ok=True)
+                save_image(img, first.output, first.config, extra=extra)
+            except Exception as e:
+                # Without the first image there is nothing to copy either
+                for index in pending:
+                    log(index, _record(jobs[index], params_hash, "failed", error=repr(e)))
+                return
+
+            timings = dict(stats.timings, encode=time.perf_counter() - t_render)
+            timings["total"] = time.perf_counter() - t_start
+            log(
+                pending[0],
+                _record(first, params_hash, "rendered", max_iter=stats.max_iter, timings=timings),
+            )
+
+            for index in pending[1:]:
+                job = jobs[index]
+                try:
+                    status = _write_copy(img, first, job, extra)
+                except Exception as e:
+                    log(index, _record(job, params_hash, "failed", error=repr(e)))
+                else:
+                    log(index, _record(job, params_hash, status, source=first.output))
+            del img
+        finally:
+            budget.release(cost)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(run_group, h, indices) for h, indices in groups.items()]
+        for future in futures:
+            future.result()
+
+    return [records[i] for i in range(len(jobs))]
+
+
+def _write_copy(img, first: BatchJob, job: BatchJob, extra: dict) -> str:
+    """Write the image of ``first`` to the output of ``job``, returning the status."""
+    Path(job.output).parent.mkdir(parents=True, exist_ok=True)
+    if Path(job.output).suffix.lower() != Path(first.output).suffix.lower():
+        save_image(img, job.output, job.config, extra=extra)
+        return "encoded"
+    shutil.copyfile(first.output, job.output)
+    sidecar = f"{first.output}{METADATA_SIDECAR_SUFFIX}"
+    if Path(sidecar).exists():
+        shutil.copyfile(sidecar, f"{job.output}{METADATA_SIDECAR_SUFFIX}")
+    return "copied"
+
+
+def _record(job: BatchJob, params_hash: str, status: str, **extra) -> dict:
+    return {
+        "line": job.line,
+        "output": job.output,
+        "hash": params_hash,
+        "status": status,
+        **extra,
+    }
@@ -0,0 +1,241 @@
+import json
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import zlib
+
+import numpy as np
+
+from mandel_fast import rs_mandelbrot_parallel
+
+# Every message is a 4-byte big-endian header length, a JSON header and a
+# payload of header["payload_size"] bytes.
+_HEADER_SIZE = struct.Struct("!I")
+
+DEFAULT_TILE_SIZE = 256
+
+
+def _send_message(sock: socket.socket, header: dict, payload: bytes = b"") -> None:
+    data = json.dumps(dict(header, payload_size=len(payload))).encode()
+    sock.sendall(_HEADER_SIZE.pack(len(data)) + data + payload)
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes | None:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            if not buf:
+                return None
+            raise ConnectionError("Connection closed in the middle of a message")
+        buf += chunk
+    return bytes(buf)
+
+
+def _recv_message(sock: socket.socket) -> tuple[dict, bytes] | None:
+    """Receive one message, or None if the peer closed the connection."""
+    raw = _recv_exact(sock, _HEADER_SIZE.size)
+    if raw is None:
+        return None
+    (length,) = _HEADER_SIZE.unpack(raw)
+    header = json.loads(_recv_exact(sock, length) or b"")
+    payload = _recv_exact(sock, header["payload_size"]) or b""
+    return header, payload
+
+
+def _render_job(job: dict, threads: int | None) -> np.ndarray:
+    return rs_mandelbrot_parallel(
+        job["width"],
+        job["height"],
+        job["max_iter"],
+        *job["extent"],
+        threads=threads,
+        tile_size=job["tile_size"],
+        region=tuple(job["region"]),
+        exact=True,
+    )
+
+
+class _TileHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        while True:
+            message = _recv_message(self.request)
+            if message is None:
+                return
+            job, _ = message
+            tile = _render_job(job, self.server.threads)
+            payload = zlib.compress(tile.astype("<u2").tobytes())
+            _send_message(
+                self.request,
+                {"id": job["id"], "shape": list(tile.shape), "dtype": "uint16"},
+                payload,
+            )
+
+
+class TileWorkerServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], threads: int | None = None):
+        super().__init__(address, _TileHandler)
+        self.threads = threads
+
+
+def serve_worker(
+    host: str,
+    port: int,
+    threads: int | None = None,
+    ready=None,
+) -> None:
+    """
+    Serve tiles to distributed render coordinators until interrupted.
+
+    Parameters
+    ----------
+    host : str
+        Interface to listen on.
+    port : int
+        Port to listen on, 0 picks a free port.
+    threads : int | None, optional
+        Number of threads used to render each tile. If None, the
+        implementation will decide the optimal number of threads.
+    ready : callable, optional
+        Called with the (host, port) the server is bound to once it listens.
+    """
+    with TileWorkerServer((host, port), threads=threads) as server:
+        if ready is not None:
+            ready(server.server_address[:2])
+        server.serve_forever()
+
+
+def parse_workers(spec: str) -> list[tuple[str, int]]:
+    """Parse a comma separated list of host:port worker addresses."""
+    workers = []
+    for item in spec.split(","):
+        host, _, port = item.strip().rpartition(":")
+        if not host or not port.isdigit():
+            raise ValueError(f"Invalid worker address: {item!r}, expected host:port")
+        workers.append((host, int(port)))
+    return workers
+
+
+def render_distributed(
+    width: int,
+    height: int,
+    max_iter: int,
+    extent: tuple[float, float, float, float],
+    workers: list[tuple[str, int]],
+    tile_size: int = DEFAULT_TILE_SIZE,
+    engine_tile_size: int | None = None,
+    timeout: float = 60.0,
+) -> np.ndarray:
+    """
+    Render the Mandelbrot set by spreading tiles over worker processes.
+
+    Tiles are handed out one at a time to whichever worker is free. A worker
+    that cannot be reached, drops the connection or does not answer within
+    ``timeout`` seconds is abandoned and its tile is given to another worker.
+
+    Parameters
+    ----------
+    width : int
+        The width of the output image in pixels.
+    height : int
+        The height of the output image in pixels.
+    max_iter : int
+        The maximum number of iterations to perform for each point.
+    extent : tuple[float, float, float, float]
+        The extent of the complex plane to render: (xmin, xmax, ymin, ymax).
+    workers : list[tuple[str, int]]
+        Addresses of the workers started with ``mandel-fast worker``.
+    tile_size : int, optional
+        Side length in pixels of the tiles sent to the workers. Default is 256.
+    engine_tile_size : int | None, optional
+        Tile size used by the parallel engine within each worker.
+    timeout : float, optional
+        Seconds to wait for a worker to answer. Default is 60.
+
+    Returns
+    -------
+    np.ndarray
+        uint16 array of shape (height, width) with the exact escape counts,
+        identical to a local render with ``rs_mandelbrot_parallel(exact=True)``.
+    """
+    out = np.zeros((height, width), dtype=np.uint16)
+    jobs = queue.Queue()
+    for y0 in range(0, height, tile_size):
+        for x0 in range(0, width, tile_size):
+            jobs.put(
+                {
+                    "id": jobs.qsize(),
+                    "width": width,
+                    "height": height,
+                    "max_iter": max_iter,
+                    "extent": list(extent),
+                    "region": [
+                        x0,
+                        y0,
+                        min(tile_size, width - x0),
+                        min(tile_size, height - y0),
+                    ],
+                    "tile_size": engine_tile_size,
+                }
+            )
+
+    n_tiles = jobs.qsize()
+    remaining = n_tiles
+    lock = threading.Lock()
+    done = threading.Event()
+    if n_tiles == 0:
+        done.set()
+
+    def drive(address):
+        nonlocal remaining
+        try:
+            sock = socket.create_connection(address, timeout=timeout)
+        except OSError:
+            return
+
+        with sock:
+            while not done.is_set():
+                try:
+                    job = jobs.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+
+                try:
+                    _send_message(sock, job)
+                    message = _recv_message(sock)
+                    if message is None:
+                        raise ConnectionError("Worker closed the connection")
+                    header, payload = message
+                    if header["id"] != job["id"]:
+                        raise ConnectionError("Worker answered the wrong tile")
+                    x0, y0, w, h = job["region"]
+                    if header["shape"] != [h, w]:
+                        raise ValueError("Worker answered a tile of the wrong shape")
+                    tile = np.frombuffer(zlib.decompress(payload), dtype="<u2")
+                    out[y0 : y0 + h, x0 : x0 + w] = tile.reshape(h, w)
+                except (OSError, ValueError, KeyError, TypeError, zlib.error):
+                    # Give the tile to another worker and stop using this one
+                    jobs.put(job)
+                    return
+
+                with lock:
+                    remaining -= 1
+                    if remaining == 0:
+                        done.set()
+
+    threads = [threading.Thread(target=drive, args=(w,), daemon=True) for w in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if not done.is_set():
+        raise RuntimeError(
+            f"All workers failed with {remaining} of {n_tiles} tiles left"
+        )
+    return out
@@ -1,8 +1,21 @@
-from mandel_fast import py_mandelbrot, rs_mandelbrot, rs_mandelbrot_parallel
-from dataclasses import dataclass
+from mandel_fast import (
+    py_mandelbrot,
+    rs_mandelbrot,
+    rs_mandelbrot_aa,
+    rs_mandelbrot_parallel,
+    RenderStats,
+)
+from dataclasses import asdict, dataclass, replace
+import hashlib
+import json
+from pathlib import Path
+import time
+from typing import Callable
 from PIL import Image
+from PIL.PngImagePlugin import PngInfo
 import numpy as np
 from matplotlib.colors import LinearSegmentedColormap
+from mandel_fast.render.auto_iter import estimate_max_iter
 
 
 @dataclass
@@ -10,13 +23,53 @@ class RenderConfig:
     width: int
     height: int
     extent: tuple[float, float, float, float]  # (xmin, xmax, ymin, ymax)
-    max_iter: int
+    max_iter: int | str  # Or "auto" to estimate it for the extent
     method: str = "rust_parallel"  # 'python', 'rust', or 'rust_parallel'
+    tile_size: int | None = None  # Tile side length for 'rust_parallel', None for default
+    samples: int = 1  # Anti-aliasing sub-samples per axis for boundary pixels, 1 disables
+    aa_threshold: float = 2.0  # Escape count difference that marks a boundary pixel
 
 
-def render_mandelbrot(config: RenderConfig) -> Image:
+def resolve_config(config: RenderConfig) -> RenderConfig:
+    """
+    Return the config with ``max_iter="auto"`` replaced by an estimated value.
 
-    # Select the appropriate Mandelbrot implenentation
+    Configs with an integer max_iter are returned unchanged.
+    """
+    if config.max_iter == "auto":
+        return replace(config, max_iter=estimate_max_iter(config.extent))
+    if not isinstance(config.max_iter, int):
+        raise ValueError(f"max_iter must be an integer or 'auto', got {config.max_iter!r}")
+    return config
+
+
+def select_engine(
+    config: RenderConfig,
+    return_stats: bool = False,
+    cost_hint: np.ndarray | None = None,
+) -> tuple[Callable[..., np.ndarray], dict]:
+    """
+    Pick the Mandelbrot implementation for a config and its keyword arguments.
+
+    The returned function is called with ``width``, ``height``, ``xmin``,
+    ``xmax``, ``ymin``, ``ymax`` and ``max_iter`` plus the returned kwargs.
+
+    Parameters
+    ----------
+    config : RenderConfig
+        The configuration of the render.
+    return_stats : bool, optional
+        If True, ask the engine for a RenderStats object as well. Not
+        supported by the 'python' method. Default is False.
+    cost_hint : np.ndarray | None, optional
+        Estimated cost per tile for the 'rust_parallel' method.
+
+    Raises
+    ------
+    ValueError
+        If the method is unknown, anti-aliasing is requested with the 'python'
+        method, or a tile size is combined with anti-aliasing.
+    """
     if config.method == "python":
         mandelbrot_func = py_mandelbrot
     elif config.method == "rust":
@@ -25,17 +78,77 @@ def render_mandelbrot(config: RenderConfig) -> Image:
         mandelbrot_func = rs_mandelbrot_parallel
     else:
         raise ValueError(f"Unknown method: {config.method}")
-    
+
+    kwargs = {}
+    if return_stats:
+        if config.method == "python":
+            raise ValueError("Render statistics require the 'rust' or 'rust_parallel' method")
+        kwargs["return_stats"] = True
+    if config.samples > 1:
+        if config.method == "python":
+            raise ValueError("Anti-aliasing requires the 'rust' or 'rust_parallel' method")
+        # The anti-aliased engine renders by rows and has no tile size
+        if config.tile_size is not None:
+            raise ValueError("A tile size cannot be combined with anti-aliasing")
+        mandelbrot_func = rs_mandelbrot_aa
+        kwargs["samples"] = config.samples
+        kwargs["threshold"] = config.aa_threshold
+        kwargs["threads"] = 1 if config.method == "rust" else None
+    elif config.method == "rust_parallel":
+        kwargs["tile_size"] = config.tile_size
+        kwargs["cost_hint"] = cost_hint
+    return mandelbrot_func, kwargs
+
+
+def render_mandelbrot(
+    config: RenderConfig,
+    return_stats: bool = False,
+    cost_hint: np.ndarray | None = None,
+    as_array: bool = False,
+) -> Image.Image | np.ndarray | tuple[Image.Image | np.ndarray, RenderStats]:
+    """
+    Render a colourised image of the Mandelbrot set.
+
+    Parameters
+    ----------
+    config : RenderConfig
+        The configuration of the render.
+    return_stats : bool, optional
+        If True, also return a RenderStats object with iteration statistics,
+        the max_iter used and wall-clock timings of the "compute" and "colorize"
+        phases, plus "estimate_max_iter" if it was "auto". Default is False.
+    cost_hint : np.ndarray | None, optional
+        Estimated cost per tile for the 'rust_parallel' method, usually the
+        ``tile_iterations`` of a previous render with the same size and tile size.
+    as_array : bool, optional
+        If True, return the colourised image as a uint8 array of shape
+        (height, width, 3) instead of a PIL Image. Default is False.
+    """
+    t_start = time.perf_counter()
+    timings = {}
+    if config.max_iter == "auto":
+        config = resolve_config(config)
+        timings["estimate_max_iter"] = time.perf_counter() - t_start
+        t_start = time.perf_counter()
+
     # Call the selected Mandelbrot function
-    mandelbrot_data = mandelbrot_func(
+    engine_stats = return_stats and config.method != "python"
+    mandelbrot_func, kwargs = select_engine(config, return_stats=engine_stats, cost_hint=cost_hint)
+    result = mandelbrot_func(
         width=config.width,
         height=config.height,
         xmin=config.extent[0],
         xmax=config.extent[1],
         ymin=config.extent[2],
         ymax=config.extent[3],
-        max_iter=config.max_iter
+        max_iter=config.max_iter,
+        **kwargs,
     )
+    if engine_stats:
+        mandelbrot_data, stats = result
+    else:
+        mandelbrot_data, stats = result, None
+    t_compute = time.perf_counter()
 
     # Convert the raw data to a PIL Image
     img_min = float(mandelbrot_data.min())
@@ -55,9 +168,87 @@ def render_mandelbrot(config: RenderConfig) -> Image:
     rgb = cmap(norm)[..., :3].astype(np.float32)
     rgb = np.clip(rgb, 0.0, 1.0)
     rgb8 = (rgb * 255).astype(np.uint8)
-    image = Image.fromarray(rgb8, mode='RGB')
+    image = rgb8 if as_array else Image.fromarray(rgb8, mode='RGB')
+
+    if not return_stats:
+        return image
+
+    t_colorize = time.perf_counter()
+    if stats is None:
+        stats = RenderStats.from_counts(mandelbrot_data, config.max_iter)
+    stats.max_iter = config.max_iter
+    stats.timings = {
+        **timings,
+        "compute": t_compute - t_start,
+        "colorize": t_colorize - t_compute,
+    }
+    return image, stats
+
+
+# Key of the PNG text chunk holding the render metadata
+METADATA_KEY = "mandel_fast"
+# Suffix appended to the path of other formats for a JSON file holding the metadata
+METADATA_SIDECAR_SUFFIX = ".meta.json"
+
+
+def config_hash(config: RenderConfig) -> str:
+    """Return a stable hash of all parameters of a RenderConfig."""
+    params = json.dumps(asdict(config), sort_keys=True)
+    return hashlib.sha256(params.encode()).hexdigest()
+
+
+def save_image(
+    image: Image.Image,
+    path: str,
+    config: RenderConfig,
+    extra: dict | None = None,
+) -> None:
+    """
+    Save an image together with the render parameters.
+
+    PNG images carry the metadata in a text chunk. For other formats it is
+    written to a JSON file next to the image, named after the image with
+    ``METADATA_SIDECAR_SUFFIX`` appended.
+
+    Parameters
+    ----------
+    image : Image.Image
+        The rendered image.
+    path : str
+        Output file path. The format is taken from the extension.
+    config : RenderConfig
+        The configuration the image was rendered with.
+    extra : dict | None, optional
+        Additional JSON serialisable entries stored in the metadata.
+    """
+    metadata = {"hash": config_hash(config), "config": asdict(config), **(extra or {})}
+    if str(path).lower().endswith(".png"):
+        pnginfo = PngInfo()
+        pnginfo.add_text(METADATA_KEY, json.dumps(metadata))
+        image.save(path, pnginfo=pnginfo)
+        return
+
+    # Remove the old metadata first, so it never describes a different image
+    sidecar = Path(f"{path}{METADATA_SIDECAR_SUFFIX}")
+    sidecar.unlink(missing_ok=True)
+    image.save(path)
+    sidecar.write_text(json.dumps(metadata))
+
+
+def read_metadata(path: str) -> dict | None:
+    """Return the metadata written by save_image, or None if there is none."""
+    if not str(path).lower().endswith(".png"):
+        sidecar = Path(f"{path}{METADATA_SIDECAR_SUFFIX}")
+        if not (sidecar.exists() and Path(path).exists()):
+            return None
+        return json.loads(sidecar.read_text())
+    try:
+        with Image.open(path) as img:
+            text = img.info.get(METADATA_KEY)
+    except (OSError, ValueError):
+        return None
+    return json.loads(text) if text else None
 
-    return image
 
 if __name__ == '__main__':
     extent = (-2.0, 1.0, -1.2, 1.2)
@@ -0,0 +1,160 @@
+import sys
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+
+# File extensions of the streaming formats, anything else is written as a GIF
+VIDEO_SUFFIXES = (".y4m", ".npy")
+
+# BT.601 limited range RGB to YCbCr in 8-bit fixed point: rows of
+# (R, G, B) weights in units of 1/256 and the offset of each plane.
+_YCBCR_WEIGHTS = ((66, 129, 25), (-38, -74, 112), (112, -94, -18))
+_YCBCR_OFFSETS = (16, 128, 128)
+
+
+class Y4MWriter:
+    """
+    Write RGB frames as an uncompressed YUV4MPEG2 stream.
+
+    Frames are converted to 8-bit BT.601 limited range YCbCr without chroma
+    subsampling (C444) and written as soon as they arrive, so the stream can
+    be piped into an external encoder, e.g. ``ffmpeg -i - out.mp4``.
+
+    Parameters
+    ----------
+    file : str | Path | BinaryIO
+        Path of the output file, "-" for stdout, or a binary file object.
+    width : int
+        The width of every frame in pixels.
+    height : int
+        The height of every frame in pixels.
+    fps : int, optional
+        Frames per second. Default is 30.
+    """
+
+    def __init__(self, file: str | Path | BinaryIO, width: int, height: int, fps: int = 30):
+        if file == "-":
+            self._file, self._owned = sys.stdout.buffer, False
+        elif isinstance(file, (str, Path)):
+            self._file, self._owned = open(file, "wb"), True
+        else:
+            self._file, self._owned = file, False
+        self.width = width
+        self.height = height
+        # Reused for every frame to keep memory constant
+        self._yuv = np.empty((3, height, width), dtype=np.uint8)
+        self._acc = np.empty((height, width), dtype=np.int32)
+        self._term = np.empty((height, width), dtype=np.int32)
+        self._file.write(f"YUV4MPEG2 W{width} H{height} F{fps}:1 Ip A1:1 C444\n".encode())
+
+    def write(self, frame: np.ndarray) -> None:
+        """Write a uint8 RGB frame of shape (height, width, 3)."""
+        _check_frame(frame, self.width, self.height)
+        acc, term = self._acc, self._term
+        for plane, weights, offset in zip(self._yuv, _YCBCR_WEIGHTS, _YCBCR_OFFSETS):
+            # Channels are read straight from the frame, every product and sum
+            # goes into the preallocated int32 buffers.
+            np.multiply(frame[..., 0], weights[0], out=acc, dtype=np.int32)
+            for channel in (1, 2):
+                np.multiply(frame[..., channel], weights[channel], out=term, dtype=np.int32)
+                np.add(acc, term, out=acc)
+            np.add(acc, 128, out=acc)
+            np.right_shift(acc, 8, out=acc)
+            np.add(acc, offset, out=acc)
+            np.copyto(plane, acc, casting="unsafe")
+        self._file.write(b"FRAME\n")
+        self._file.write(self._yuv.data)
+
+    def close(self) -> None:
+        self._file.flush()
+        if self._owned:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class NpyFrameWriter:
+    """
+    Write RGB frames into a memory-mapped ``.npy`` stack.
+
+    The file holds a uint8 array of shape (n_frames, height, width, 3) and can
+    be opened with ``np.load(path, mmap_mode="r")`` without reading it whole.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path of the output file.
+    n_frames : int
+        The number of frames that will be written.
+    width : int
+        The width of every frame in pixels.
+    height : int
+        The height of every frame in pixels.
+    """
+
+    def __init__(self, path: str | Path, n_frames: int, width: int, height: int):
+        self.width = width
+        self.height = height
+        self._stack = np.lib.format.open_memmap(
+            path, mode="w+", dtype=np.uint8, shape=(n_frames, height, width, 3)
+        )
+        self._index = 0
+
+    def write(self, frame: np.ndarray) -> None:
+        """Write a uint8 RGB frame of shape (height, width, 3)."""
+        _check_frame(frame, self.width, self.height)
+        if self._index >= len(self._stack):
+            raise ValueError(f"The stack only holds {len(self._stack)} frames")
+        self._stack[self._index] = frame
+        self._index += 1
+
+    def close(self) -> None:
+        if self._stack is None:
+            return
+        self._stack.flush()
+        # Drop the reference so the file is unmapped
+        self._stack = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _check_frame(frame: np.ndarray, width: int, height: int) -> None:
+    if frame.dtype != np.uint8 or frame.shape != (height, width, 3):
+        raise ValueError(
+            f"Expected a uint8 frame of shape {(height, width, 3)}, "
+            f"got {frame.dtype} {frame.shape}"
+        )
+
+
+def is_video_path(path: str | Path) -> bool:
+    """Whether frames for ``path`` are streamed by open_video_writer rather than written as a GIF."""
+    return str(path) == "-" or Path(path).suffix.lower() in VIDEO_SUFFIXES
+
+
+def open_video_writer(
+    path: str | Path,
+    n_frames: int,
+    width: int,
+    height: int,
+    fps: int = 30,
+) -> Y4MWriter | NpyFrameWriter:
+    """
+    Open a streaming frame writer chosen by the extension of ``path``.
+
+    "-" streams YUV4MPEG2 to stdout, ``.y4m`` writes a YUV4MPEG2 file and
+    ``.npy`` a memory-mapped frame stack.
+    """
+    if str(path) == "-" or Path(path).suffix.lower() == ".y4m":
+        return Y4MWriter(path, width, height, fps=fps)
+    if Path(path).suffix.lower() == ".npy":
+        return NpyFrameWriter(path, n_frames, width, height)
+    raise ValueError(f"Unknown video format: {path}, expected one of {VIDEO_SUFFIXES} or '-'")
@@ -1,5 +1,6 @@
 import matplotlib.pyplot as plt
 import numpy as np
+from mandel_fast.bench import load_history
 
 def adjust_plt_params():
     plt.rcParams.update({
@@ -12,35 +13,75 @@ def adjust_plt_params():
         'lines.markersize': 7,
     })
 
-def plot_benchmark_results(npz_file='bench_results.npz', output_file='benchmark_plot.png'):
-    data = np.load(npz_file)
-    pixels = data['pixels']
-    py_times = data['py_times']
-    rs_times = data['rs_times']
-    rs_parallel_times = data['rs_parallel_times']
-    np_times = data['np_times']
+def plot_benchmark_results(history_file='bench_history.json', output_file='benchmark_plot.png'):
+    runs = load_history(history_file)
+    if not runs:
+        raise ValueError(f"No benchmark runs found in {history_file}")
+    results = runs[-1]['results']
 
-    fig, axes = plt.subplots(1, 2, figsize=(12, 6), layout='constrained')
+    workloads = list(dict.fromkeys(r.workload for r in results))
+    engines = list(dict.fromkeys(r.engine for r in results))
+    max_iter = max(r.max_iter for r in results)
+    results = [r for r in results if r.max_iter == max_iter]
 
+    fig, axes = plt.subplots(1, 2, figsize=(12, 6), layout='constrained')
 
+    # First subplot: throughput per workload using the most threads for each engine.
+    # Of the tile sizes and schedules swept, the default is used, or else the fastest.
     ax = axes[0]
-    ax.plot(pixels, py_times, 'o-', label='Python Implementation', color='blue')
-    ax.plot(pixels, np_times, 'x-', label='NumPy Implementation', color='red')
-    ax.plot(pixels, rs_times, 's-', label='Rust Implementation', color='orange')
-    ax.plot(pixels, rs_parallel_times, '^-', label='Rust Parallel Implementation', color='green')
-    ax.set_ylabel('Time (seconds)')
-    ax.set_xlabel('Number of Pixels')
-    ax.set_xscale('log')
+    bar_width = 0.8 / len(engines)
+    x = np.arange(len(workloads))
+    for k, engine in enumerate(engines):
+        best = {}
+        label = engine
+        for workload in workloads:
+            candidates = [r for r in results if r.engine == engine and r.workload == workload]
+            if not candidates:
+                continue
+            threads = max(r.threads for r in candidates)
+            candidates = [r for r in candidates if r.threads == threads]
+            default = [r for r in candidates if r.tile_size is None and r.schedule == 'tiles']
+            if default:
+                best[workload] = default[0]
+            else:
+                best[workload] = max(candidates, key=lambda r: r.pixels_per_sec.median)
+                label = f'{engine} (fastest tile size / schedule)'
+        values = [best[w].pixels_per_sec.median if w in best else np.nan for w in workloads]
+        low = [best[w].pixels_per_sec.ci_low if w in best else np.nan for w in workloads]
+        high = [best[w].pixels_per_sec.ci_high if w in best else np.nan for w in workloads]
+        yerr = [np.subtract(values, low), np.subtract(high, values)]
+        ax.bar(x + k * bar_width, values, bar_width, yerr=yerr, label=label)
+    ax.set_xticks(x + bar_width * (len(engines) - 1) / 2, workloads)
+    ax.set_ylabel('Pixels / second')
+    ax.set_yscale('log')
+    ax.set_title(f'max_iter = {max_iter}')
     ax.legend(framealpha=0.5)
 
-    # Second subplot: Speedup
+    # Second subplot: parallel efficiency of the parallel engine
     ax = axes[1]
-    ax.plot(pixels, py_times / rs_times, 's-', label='Rust Speedup', color='orange')
-    ax.plot(pixels, py_times / np_times, 'x-', label='NumPy Speedup', color='red')
-    ax.plot(pixels, py_times / rs_parallel_times, '^-', label='Rust Parallel Speedup', color='green')
-    ax.set_ylabel('Speedup (Python Time / Rust Time)')
-    ax.set_xlabel('Number of Pixels')
-    ax.set_xscale('log')
+    variants = list(dict.fromkeys((r.tile_size, r.schedule) for r in results if r.efficiency is not None))
+    for workload, (tile_size, schedule) in [(w, v) for w in workloads for v in variants]:
+        scaling = sorted(
+            (r for r in results if r.workload == workload and (r.tile_size, r.schedule) == (tile_size, schedule) and r.efficiency is not None),
+            key=lambda r: r.threads,
+        )
+        if not scaling:
+            continue
+        if len(variants) == 1:
+            label = workload
+        elif schedule.startswith('rows'):
+            label = f'{workload} ({schedule})'
+        else:
+            label = f'{workload} ({schedule}, tile {tile_size or "default"})'
+        threads = [1] + [r.threads for r in scaling]
+        eff = np.array([1.0] + [r.efficiency.median for r in scaling])
+        low = np.array([1.0] + [r.efficiency.ci_low for r in scaling])
+        high = np.array([1.0] + [r.efficiency.ci_high for r in scaling])
+        ax.errorbar(threads, eff, yerr=[eff - low, high - eff], fmt='o-', label=label, capsize=4)
+    ax.set_ylabel('Parallel efficiency')
+    ax.set_xlabel('Threads')
+    ax.set_xscale('log', base=2)
+    ax.set_ylim(0, 1.1)
     ax.legend(framealpha=0.5)
 
     fig.savefig(output_file, transparent=True, bbox_inches='tight')
@@ -50,4 +91,4 @@ def plot_benchmark_results(npz_file='bench_results.npz', output_file='benchmark_
 
 if __name__ == '__main__':
     adjust_plt_params()
-    plot_benchmark_results()
\ No newline at end of file
+    plot_benchmark_results()
@@ -1,6 +1,143 @@
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
 use rayon::prelude::*;
-use rayon::ThreadPoolBuilder;
+use rayon::{ThreadPool, ThreadPoolBuilder};
+use std::cmp::Ordering as CmpOrdering;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::time::Instant;
+
+const DEFAULT_TILE_SIZE: usize = 64;
+// Values of the `schedule` argument of mandelbrot_parallel.
+const SCHEDULES: [&str; 4] = ["tiles", "tiles_unordered", "rows", "rows_unordered"];
+// Number of probe samples along each side of a tile when estimating its cost.
+const PROBE_SAMPLES: usize = 4;
+
+/// Statistics collected while rendering, returned when `stats=True`.
+#[pyclass(get_all)]
+#[derive(Clone, Default)]
+struct RawStats {
+    total_iterations: u64,
+    escaped: u64,
+    interior: u64,
+    row_iterations: Vec<u64>,
+    tile_iterations: Vec<u64>, // row-major over the tile grid, empty for untiled renders
+    tiles_x: usize,
+    tiles_y: usize,
+    thread_busy: Vec<f64>, // seconds spent computing, per worker thread
+    supersampled: u64,     // pixels resampled by anti-aliasing
+}
+
+impl RawStats {
+    fn from_rows(row_iterations: Vec<u64>, row_interior: &[u64], thread_busy: Vec<f64>, pixels: usize) -> Self {
+        let interior: u64 = row_interior.iter().sum();
+        RawStats {
+            total_iterations: row_iterations.iter().sum(),
+            escaped: pixels as u64 - interior,
+            interior,
+            row_iterations,
+            thread_busy,
+            ..Default::default()
+        }
+    }
+}
+
+/// Maps pixel indices to points in the complex plane.
+#[derive(Clone, Copy)]
+struct Viewport {
+    width: usize,
+    height: usize,
+    xmin: f64,
+    xmax: f64,
+    ymin: f64,
+    ymax: f64,
+}
+
+impl Viewport {
+    fn x(&self, i: usize) -> f64 {
+        self.xmin + (self.xmax - self.xmin) * (i as f64) / ((self.width - 1).max(1) as f64)
+    }
+
+    fn y(&self, j: usize) -> f64 {
+        self.ymin + (self.ymax - self.ymin) * (j as f64) / ((self.height - 1).max(1) as f64)
+    }
+}
+
+/// Splits a region of an image into tiles, numbered row-major.
+/// Tile rectangles are relative to the region, which starts at (x_offset, y_offset).
+#[derive(Clone, Copy)]
+struct TileGrid {
+    width: usize,
+    height: usize,
+    x_offset: usize,
+    y_offset: usize,
+    tile_width: usize,
+    tile_height: usize,
+    tiles_x: usize,
+    tiles_y: usize,
+}
+
+impl TileGrid {
+    fn new(
+        width: usize,
+        height: usize,
+        x_offset: usize,
+        y_offset: usize,
+        tile_width: usize,
+        tile_height: usize,
+    ) -> Self {
+        TileGrid {
+            width,
+            height,
+            x_offset,
+            y_offset,
+            tile_width,
+            tile_height,
+            tiles_x: (width + tile_width - 1) / tile_width,
+            tiles_y: (height + tile_height - 1) / tile_height,
+        }
+    }
+
+    fn len(&self) -> usize {
+        self.tiles_x * self.tiles_y
+    }
+
+    /// Returns (x0, y0, w, h) of tile `t`.
+    fn rect(&self, t: usize) -> (usize, usize, usize, usize) {
+        let x0 = (t % self.tiles_x) * self.tile_width;
+        let y0 = (t / self.tiles_x) * self.tile_height;
+        (
+            x0,
+            y0,
+            self.tile_width.min(self.width - x0),
+            self.tile_height.min(self.height - y0),
+        )
+    }
+}
+
+/// Element type of an output buffer holding escape counts.
+trait Pixel: Copy + Default + Send + Sync {
+    fn from_count(count: u16) -> Self;
+}
+
+impl Pixel for u8 {
+    // map iterations to 0..255 for display
+    fn from_count(count: u16) -> Self {
+        count.min(255) as u8
+    }
+}
+
+impl Pixel for u16 {
+    fn from_count(count: u16) -> Self {
+        count
+    }
+}
+
+struct TileResult<P> {
+    index: usize,
+    pixels: Vec<P>, // row-major, tile width * tile height
+    row_iterations: Vec<u64>,
+    interior: u64,
+}
 
 fn mandel_escape(cx: f64, cy: f64, max_iter: u16) -> u16 {
     let mut x = 0.0_f64;
@@ -16,8 +153,122 @@ fn mandel_escape(cx: f64, cy: f64, max_iter: u16) -> u16 {
     i
 }
 
+/// Fill a horizontal span of row `j` starting at column `i0`, returning
+/// (iterations, interior pixels) for the span.
+fn fill_span<P: Pixel>(span: &mut [P], i0: usize, j: usize, view: &Viewport, max_iter: u16) -> (u64, u64) {
+    let y = view.y(j);
+    let mut iterations = 0u64;
+    let mut interior = 0u64;
+    for (k, v) in span.iter_mut().enumerate() {
+        let it = mandel_escape(view.x(i0 + k), y, max_iter);
+        iterations += it as u64;
+        interior += (it == max_iter) as u64;
+        *v = P::from_count(it);
+    }
+    (iterations, interior)
+}
+
+fn render_tile<P: Pixel>(index: usize, grid: &TileGrid, view: &Viewport, max_iter: u16) -> TileResult<P> {
+    let (x0, y0, w, h) = grid.rect(index);
+    let mut pixels = vec![P::default(); w * h];
+    let mut row_iterations = vec![0u64; h];
+    let mut interior = 0u64;
+    let (i0, j0) = (grid.x_offset + x0, grid.y_offset + y0);
+    for (r, span) in pixels.chunks_mut(w).enumerate() {
+        let (iters, inside) = fill_span(span, i0, j0 + r, view, max_iter);
+        row_iterations[r] = iters;
+        interior += inside;
+    }
+    TileResult { index, pixels, row_iterations, interior }
+}
+
+/// Estimate the cost of a tile from a sparse grid of probe samples, scaled to the tile area.
+fn probe_cost(index: usize, grid: &TileGrid, view: &Viewport, max_iter: u16) -> f64 {
+    let (x0, y0, w, h) = grid.rect(index);
+    let (i0, j0) = (grid.x_offset + x0, grid.y_offset + y0);
+    // Thin tiles such as single rows get fewer samples along their short side
+    let (nx, ny) = (PROBE_SAMPLES.min(w), PROBE_SAMPLES.min(h));
+    let mut cost = 0u64;
+    for a in 0..ny {
+        let j = j0 + (2 * a + 1) * h / (2 * ny);
+        for b in 0..nx {
+            let i = i0 + (2 * b + 1) * w / (2 * nx);
+            cost += mandel_escape(view.x(i), view.y(j), max_iter) as u64;
+        }
+    }
+    cost as f64 * (w * h) as f64 / (nx * ny) as f64
+}
+
+/// Average escape count over a `samples` x `samples` grid of sub-pixel points
+/// around pixel (i, j), returning (average, total iterations).
+fn supersample(i: usize, j: usize, view: &Viewport, samples: usize, max_iter: u16) -> (f32, u64) {
+    let dx = (view.xmax - view.xmin) / ((view.width - 1).max(1) as f64);
+    let dy = (view.ymax - view.ymin) / ((view.height - 1).max(1) as f64);
+    let (x, y) = (view.x(i), view.y(j));
+    let mut total = 0u64;
+    for a in 0..samples {
+        let oy = ((a as f64 + 0.5) / samples as f64 - 0.5) * dy;
+        for b in 0..samples {
+            let ox = ((b as f64 + 0.5) / samples as f64 - 0.5) * dx;
+            total += mandel_escape(x + ox, y + oy, max_iter) as u64;
+        }
+    }
+    (total as f32 / (samples * samples) as f32, total)
+}
+
+/// True if any of the 8 neighbours of pixel (i, j) differs by more than `threshold` iterations.
+fn on_boundary(counts: &[u16], i: usize, j: usize, width: usize, height: usize, threshold: f64) -> bool {
+    let c = counts[j * width + i] as f64;
+    for jj in j.saturating_sub(1)..=(j + 1).min(height - 1) {
+        for ii in i.saturating_sub(1)..=(i + 1).min(width - 1) {
+            if (counts[jj * width + ii] as f64 - c).abs() > threshold {
+                return true;
+            }
+        }
+    }
+    false
+}
+
+fn build_pool(threads: Option<usize>) -> PyResult<Option<ThreadPool>> {
+    // Build a pool only if user requests an explicit thread count.
+    // This keeps the default behavior simple and avoids global thread-pool fiddling.
+    match threads {
+        Some(n) if n >= 1 => Ok(Some(
+            ThreadPoolBuilder::new()
+                .num_threads(n)
+                .build()
+                .map_err(|e| PyRuntimeError::new_err(e.to_string()))?,
+        )),
+        _ => Ok(None),
+    }
+}
+
+/// Busy time per worker thread in nanoseconds, indexed by the Rayon thread index.
+fn busy_counters(pool: Option<&ThreadPool>) -> Vec<AtomicU64> {
+    let num_threads = match pool {
+        Some(pool) => pool.current_num_threads(),
+        None => rayon::current_num_threads(),
+    };
+    (0..num_threads).map(|_| AtomicU64::new(0)).collect()
+}
+
+fn record_busy(busy: &[AtomicU64], t0: Option<Instant>) {
+    if let Some(t0) = t0 {
+        let idx = rayon::current_thread_index().unwrap_or(0) % busy.len();
+        busy[idx].fetch_add(t0.elapsed().as_nanos() as u64, Ordering::Relaxed);
+    }
+}
+
+fn busy_seconds(busy: &[AtomicU64]) -> Vec<f64> {
+    busy.iter()
+        .map(|ns| ns.load(Ordering::Relaxed) as f64 * 1e-9)
+        .collect()
+}
+
 #[pyfunction]
+#[pyo3(signature = (width, height, max_iter, xmin, xmax, ymin, ymax, stats=false))]
 fn mandelbrot(
+    py: Python<'_>,
     width: usize,
     height: usize,
     max_iter: u16,
@@ -25,24 +276,30 @@ fn mandelbrot(
     xmax: f64,
     ymin: f64,
     ymax: f64,
-) -> PyResult<Vec<u8>> {
+    stats: bool,
+) -> PyResult<PyObject> {
+    let view = Viewport { width, height, xmin, xmax, ymin, ymax };
     let mut out = vec![0u8; width * height];
+    let mut row_iterations = vec![0u64; height];
+    let mut row_interior = vec![0u64; height];
 
-    for j in 0..height {
-        let y = ymin + (ymax - ymin) * (j as f64) / ((height - 1).max(1) as f64);
-        for i in 0..width {
-            let x = xmin + (xmax - xmin) * (i as f64) / ((width - 1).max(1) as f64);
-            let it = mandel_escape(x, y, max_iter);
-            // map iterations to 0..255 for display
-            let v = if max_iter <= 255 { it as u8 } else { (it.min(255)) as u8 };
-            out[j * width + i] = v;
+    let t0 = Instant::now();
+    if width > 0 {
+        for (j, row) in out.chunks_mut(width).enumerate() {
+            (row_iterations[j], row_interior[j]) = fill_span(row, 0, j, &view, max_iter);
         }
     }
 
-    Ok(out)
+    if stats {
+        let busy = vec![t0.elapsed().as_secs_f64()];
+        let raw = RawStats::from_rows(row_iterations, &row_interior, busy, width * height);
+        return Ok((out, raw).into_py(py));
+    }
+    Ok(out.into_py(py))
 }
 
 #[pyfunction]
+#[pyo3(signature = (width, height, max_iter, xmin, xmax, ymin, ymax, threads=None, stats=false, tile_size=None, cost_hint=None, region=None, schedule="tiles", exact=false))]
 fn mandelbrot_parallel(
     py: Python<'_>,
     width: usize,
@@ -53,56 +310,253 @@ fn mandelbrot_parallel(
     ymin: f64,
     ymax: f64,
     threads: Option<usize>, // None => Rayon default; Some(1) => effectively single-threaded
-) -> PyResult<Vec<u8>> {
-    if width == 0 || height == 0 {
-        return Ok(Vec::new());
+    stats: bool,
+    tile_size: Option<usize>, // None => DEFAULT_TILE_SIZE
+    cost_hint: Option<Vec<f64>>, // Estimated cost per tile, None => probe at low resolution
+    region: Option<(usize, usize, usize, usize)>, // (x0, y0, w, h) to compute, None => whole image
+    schedule: &str, // Task shape and order, see SCHEDULES
+    exact: bool, // Return u16 escape counts instead of u8 counts clamped to 255
+) -> PyResult<PyObject> {
+    let (x_offset, y_offset, out_width, out_height) = region.unwrap_or((0, 0, width, height));
+    if x_offset + out_width > width || y_offset + out_height > height {
+        return Err(PyValueError::new_err("region must lie inside the image"));
+    }
+    if out_width == 0 || out_height == 0 {
+        return Ok(buffer_to_py(py, Vec::<u8>::new(), RawStats::default(), stats));
     }
 
-    // Allocate output (row-major)
-    let mut out = vec![0u8; width * height];
-
-    // Build a pool only if user requests an explicit thread count.
-    // This keeps the default behavior simple and avoids global thread-pool fiddling.
-    let maybe_pool = match threads {
-        Some(n) if n >= 1 => Some(
-            ThreadPoolBuilder::new()
-                .num_threads(n)
-                .build()
-                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?,
-        ),
-        _ => None,
+    let tile_size = tile_size.unwrap_or(DEFAULT_TILE_SIZE);
+    if tile_size == 0 {
+        return Err(PyValueError::new_err("tile_size must be positive"));
+    }
+    // Rows are tiles spanning the full width, unordered schedules hand out
+    // tasks in image order through Rayon's work-stealing splitter.
+    let (tile_width, tile_height, ordered) = match schedule {
+        "tiles" => (tile_size, tile_size, true),
+        "tiles_unordered" => (tile_size, tile_size, false),
+        "rows" => (out_width, 1, true),
+        "rows_unordered" => (out_width, 1, false),
+        _ => {
+            return Err(PyValueError::new_err(format!(
+                "Unknown schedule {schedule:?}, expected one of {SCHEDULES:?}"
+            )))
+        }
     };
+    let view = Viewport { width, height, xmin, xmax, ymin, ymax };
+    let grid = TileGrid::new(out_width, out_height, x_offset, y_offset, tile_width, tile_height);
+    if let Some(hint) = cost_hint.as_ref() {
+        if hint.len() != grid.len() {
+            return Err(PyValueError::new_err(format!(
+                "cost_hint has {} entries but the image has {} tiles",
+                hint.len(),
+                grid.len()
+            )));
+        }
+    }
+
+    let pool = build_pool(threads)?;
+    let (pool, hint) = (pool.as_ref(), cost_hint.as_deref());
+    if exact {
+        let (out, raw) = render_tiles::<u16>(py, &grid, &view, max_iter, ordered, hint, pool, stats);
+        return Ok(buffer_to_py(py, out, raw, stats));
+    }
+    let (out, raw) = render_tiles::<u8>(py, &grid, &view, max_iter, ordered, hint, pool, stats);
+    Ok(buffer_to_py(py, out, raw, stats))
+}
+
+/// The output buffer, or a tuple of the buffer and its statistics if `stats`.
+fn buffer_to_py<P>(py: Python<'_>, out: Vec<P>, raw: RawStats, stats: bool) -> PyObject
+where
+    Vec<P>: IntoPy<PyObject>,
+{
+    if stats {
+        (out, raw).into_py(py)
+    } else {
+        out.into_py(py)
+    }
+}
+
+/// Render every tile of `grid` on the pool and assemble them into a row-major
+/// buffer of the grid's size, with statistics. Busy times are only measured if `stats`.
+#[allow(clippy::too_many_arguments)]
+fn render_tiles<P: Pixel>(
+    py: Python<'_>,
+    grid: &TileGrid,
+    view: &Viewport,
+    max_iter: u16,
+    ordered: bool,
+    cost_hint: Option<&[f64]>,
+    pool: Option<&ThreadPool>,
+    stats: bool,
+) -> (Vec<P>, RawStats) {
+    let busy = busy_counters(pool);
 
     // Release the GIL while computing (important when you parallelize).
+    let tiles = py.allow_threads(|| {
+        let render = |t: usize| {
+            let t0 = if stats { Some(Instant::now()) } else { None };
+            let tile = render_tile::<P>(t, grid, view, max_iter);
+            record_busy(&busy, t0);
+            tile
+        };
+        let compute = || {
+            if !ordered {
+                return (0..grid.len())
+                    .into_par_iter()
+                    .map(&render)
+                    .collect::<Vec<TileResult<P>>>();
+            }
+            let costs: Vec<f64> = match cost_hint {
+                Some(hint) => hint.to_vec(),
+                None => (0..grid.len())
+                    .into_par_iter()
+                    .map(|t| probe_cost(t, grid, view, max_iter))
+                    .collect(),
+            };
+
+            // Start the most expensive tiles first so the cheap ones fill in the
+            // gaps at the end. par_bridge hands tiles out in order to idle workers.
+            let mut order: Vec<usize> = (0..grid.len()).collect();
+            order.sort_by(|&a, &b| costs[b].partial_cmp(&costs[a]).unwrap_or(CmpOrdering::Equal));
+
+            order.into_iter().par_bridge().map(&render).collect::<Vec<TileResult<P>>>()
+        };
+
+        match pool {
+            Some(pool) => pool.install(compute),
+            None => compute(),
+        }
+    });
+
+    // Assemble the tiles into the output image (row-major).
+    let (out_width, out_height) = (grid.width, grid.height);
+    let mut out = vec![P::default(); out_width * out_height];
+    let mut row_iterations = vec![0u64; out_height];
+    let mut tile_iterations = vec![0u64; grid.len()];
+    let mut interior = 0u64;
+    for tile in tiles {
+        let (x0, y0, w, _) = grid.rect(tile.index);
+        for (r, span) in tile.pixels.chunks(w).enumerate() {
+            let start = (y0 + r) * out_width + x0;
+            out[start..start + w].copy_from_slice(span);
+            row_iterations[y0 + r] += tile.row_iterations[r];
+        }
+        tile_iterations[tile.index] = tile.row_iterations.iter().sum();
+        interior += tile.interior;
+    }
+
+    let raw = RawStats {
+        total_iterations: tile_iterations.iter().sum(),
+        escaped: (out_width * out_height) as u64 - interior,
+        interior,
+        row_iterations,
+        tile_iterations,
+        tiles_x: grid.tiles_x,
+        tiles_y: grid.tiles_y,
+        thread_busy: busy_seconds(&busy),
+        ..Default::default()
+    };
+    (out, raw)
+}
+
+#[pyfunction]
+#[pyo3(signature = (width, height, max_iter, xmin, xmax, ymin, ymax, samples=4, threshold=2.0, threads=None, stats=false))]
+fn mandelbrot_aa(
+    py: Python<'_>,
+    width: usize,
+    height: usize,
+    max_iter: u16,
+    xmin: f64,
+    xmax: f64,
+    ymin: f64,
+    ymax: f64,
+    samples: usize, // sub-pixel grid is samples x samples
+    threshold: f64, // resample pixels whose neighbours differ by more than this many iterations
+    threads: Option<usize>,
+    stats: bool,
+) -> PyResult<PyObject> {
+    if samples == 0 {
+        return Err(PyValueError::new_err("samples must be positive"));
+    }
+    if width == 0 || height == 0 {
+        let out: Vec<f32> = Vec::new();
+        if stats {
+            return Ok((out, RawStats::default()).into_py(py));
+        }
+        return Ok(out.into_py(py));
+    }
+
+    let view = Viewport { width, height, xmin, xmax, ymin, ymax };
+    let maybe_pool = build_pool(threads)?;
+    let busy = busy_counters(maybe_pool.as_ref());
+
+    let mut counts = vec![0u16; width * height];
+    let mut out = vec![0f32; width * height];
+    let mut row_iterations = vec![0u64; height];
+    let mut row_interior = vec![0u64; height];
+    let mut row_supersampled = vec![0u64; height];
+
     py.allow_threads(|| {
         let mut compute = || {
-            // Parallelize by rows: each thread fills one or more rows.
+            // Pass 1: escape counts at native resolution.
+            counts
+                .par_chunks_mut(width)
+                .zip(row_interior.par_iter_mut())
+                .enumerate()
+                .for_each(|(j, (row, interior))| {
+                    let t0 = if stats { Some(Instant::now()) } else { None };
+                    let y = view.y(j);
+                    for (i, v) in row.iter_mut().enumerate() {
+                        *v = mandel_escape(view.x(i), y, max_iter);
+                        *interior += (*v == max_iter) as u64;
+                    }
+                    record_busy(&busy, t0);
+                });
+
+            // Pass 2: supersample only the pixels on a boundary between escape counts,
+            // so the cost scales with the boundary length rather than the area.
+            let counts = &counts;
             out.par_chunks_mut(width)
+                .zip(row_iterations.par_iter_mut())
+                .zip(row_supersampled.par_iter_mut())
                 .enumerate()
-                .for_each(|(j, row)| {
-                    let y = ymin + (ymax - ymin) * (j as f64) / ((height - 1).max(1) as f64);
-                    for i in 0..width {
-                        let x = xmin + (xmax - xmin) * (i as f64) / ((width - 1).max(1) as f64);
-                        let it = mandel_escape(x, y, max_iter);
-                        let v = if max_iter <= 255 { it as u8 } else { it.min(255) as u8 };
-                        row[i] = v;
+                .for_each(|(j, ((row, iterations), supersampled))| {
+                    let t0 = if stats { Some(Instant::now()) } else { None };
+                    for (i, v) in row.iter_mut().enumerate() {
+                        let c = counts[j * width + i];
+                        *iterations += c as u64;
+                        if samples > 1 && on_boundary(counts, i, j, width, height, threshold) {
+                            let (avg, total) = supersample(i, j, &view, samples, max_iter);
+                            *v = avg;
+                            *iterations += total;
+                            *supersampled += 1;
+                        } else {
+                            *v = c as f32;
+                        }
                     }
+                    record_busy(&busy, t0);
                 });
         };
 
-        if let Some(pool) = maybe_pool.as_ref() {
-            pool.install(compute);
-        } else {
-            compute();
+        match maybe_pool.as_ref() {
+            Some(pool) => pool.install(compute),
+            None => compute(),
         }
     });
 
-    Ok(out)
+    if stats {
+        let mut raw = RawStats::from_rows(row_iterations, &row_interior, busy_seconds(&busy), width * height);
+        raw.supersampled = row_supersampled.iter().sum();
+        return Ok((out, raw).into_py(py));
+    }
+    Ok(out.into_py(py))
 }
 
 #[pymodule]
 fn _rust(_py: Python<'_>, m: &PyModule) -> PyResult<()> {
+    m.add_class::<RawStats>()?;
     m.add_function(wrap_pyfunction!(mandelbrot, m)?)?;
     m.add_function(wrap_pyfunction!(mandelbrot_parallel, m)?)?;
+    m.add_function(wrap_pyfunction!(mandelbrot_aa, m)?)?;
     Ok(())
 }
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from mandel_fast import py_mandelbrot, rs_mandelbrot_aa
+from mandel_fast.core.py_impl import mandel_escape
+
+
+def _py_mandelbrot_aa(width, height, max_iter, extent, samples, threshold):
+    """Reference implementation of adaptive supersampling in pure Python."""
+    xmin, xmax, ymin, ymax = extent
+    counts = py_mandelbrot(width, height, max_iter, *extent).astype(np.int64)
+    out = counts.astype(np.float32)
+    dx = (xmax - xmin) / max(width - 1, 1)
+    dy = (ymax - ymin) / max(height - 1, 1)
+    for j in range(height):
+        y = ymin + (ymax - ymin) * j / max(height - 1, 1)
+        for i in range(width):
+            neighbours = counts[max(j - 1, 0) : j + 2, max(i - 1, 0) : i + 2]
+            if np.abs(neighbours - counts[j, i]).max() <= threshold:
+                continue
+            x = xmin + (xmax - xmin) * i / max(width - 1, 1)
+            total = 0
+            for a in range(samples):
+                oy = ((a + 0.5) / samples - 0.5) * dy
+                for b in range(samples):
+                    ox = ((b + 0.5) / samples - 0.5) * dx
+                    total += mandel_escape(x + ox, y + oy, max_iter)
+            out[j, i] = total / (samples * samples)
+    return out
+
+
+@pytest.mark.parametrize("samples,threshold", [(2, 2.0), (3, 10.0)])
+def test_rs_mandelbrot_aa_vs_py(samples, threshold):
+    """Test that the Rust adaptive supersampling matches the Python reference."""
+    width, height, max_iter, extent = 60, 45, 100, (-2.0, 1.0, -1.2, 1.2)
+    img, stats = rs_mandelbrot_aa(
+        width, height, max_iter, *extent, samples=samples, threshold=threshold,
+        return_stats=True,
+    )
+    expected = _py_mandelbrot_aa(width, height, max_iter, extent, samples, threshold)
+    np.testing.assert_allclose(img, expected, rtol=1e-6)
+    assert 0 < stats.supersampled < width * height
+
+
+def test_rs_mandelbrot_aa_without_boundary(mandelbrot_settings, py_mandelbrot_result):
+    """Test that nothing is resampled when no neighbours differ beyond the threshold."""
+    width, height, max_iter, extent = mandelbrot_settings
+    img, stats = rs_mandelbrot_aa(
+        width, height, max_iter, *extent, threshold=max_iter, return_stats=True
+    )
+    np.testing.assert_array_equal(img, py_mandelbrot_result)
+    assert stats.supersampled == 0
+
+
+def test_render_aa_rejects_tile_size(tmp_path):
+    """Test that a tile size combined with anti-aliasing is rejected, not ignored."""
+    from click.testing import CliRunner
+    from mandel_fast.cli import main
+    from mandel_fast.render.render import RenderConfig, render_mandelbrot
+
+    config = RenderConfig(40, 30, (-2.0, 1.0, -1.2, 1.2), 50, tile_size=16, samples=2)
+    with pytest.raises(ValueError, match="tile size"):
+        render_mandelbrot(config)
+
+    result = CliRunner().invoke(
+        main, ["render", "-w", "40", "-h", "30", "-T", "16", "-s", "2", "-o", str(tmp_path / "aa.png")]
+    )
+    assert result.exit_code == 2
+    assert "--tile-size" in result.output
+    assert not (tmp_path / "aa.png").exists()
@@ -0,0 +1,75 @@
+import json
+
+from mandel_fast import rs_mandelbrot_parallel
+
+from mandel_fast.render.auto_iter import estimate_max_iter
+from mandel_fast.render.batch import load_jobs, run_batch
+from mandel_fast.render.render import RenderConfig, read_metadata, render_mandelbrot, resolve_config
+
+SEAHORSE = (-0.7475, -0.7425, 0.105, 0.11)
+
+
+def test_estimate_grows_with_zoom():
+    """Test that deeper zooms get a larger iteration budget than the full set."""
+    full = estimate_max_iter((-2.0, 1.0, -1.5, 1.5), probe_size=32)
+    deep = estimate_max_iter(SEAHORSE, probe_size=32)
+    assert 64 <= full <= 1024
+    assert deep > full
+
+
+def test_estimate_raises_budget_until_stable():
+    """Test that a view whose pixels all escape beyond the first budget gets enough iterations."""
+    extent = (0.25 + 1e-8, 0.25 + 2e-8, -1e-15, 1e-15)
+    max_iter = estimate_max_iter(extent)
+    counts = rs_mandelbrot_parallel(64, 1, max_iter, *extent, exact=True)
+    assert counts.min() > 16384
+    assert (counts < max_iter).all()
+
+
+def test_probe_size_is_capped():
+    """Test that the probe follows the aspect ratio without exceeding probe_size on either side."""
+    from mandel_fast.render.auto_iter import _probe_counts
+
+    assert _probe_counts((0.0, 1e-6, -1.0, 1.0), 64, 10).shape == (64, 1)
+    assert _probe_counts((-2.0, 1.0, -0.75, 0.75), 64, 10).shape == (32, 64)
+
+
+def test_resolve_config():
+    """Test that only 'auto' configs are changed when resolving max_iter."""
+    config = RenderConfig(width=32, height=32, extent=(-2.0, 1.0, -1.5, 1.5), max_iter=100)
+    assert resolve_config(config) is config
+
+    resolved = resolve_config(RenderConfig(width=32, height=32, extent=config.extent, max_iter="auto"))
+    assert isinstance(resolved.max_iter, int)
+
+
+def test_render_auto_records_max_iter():
+    """Test that an 'auto' render reports the chosen max_iter in its statistics."""
+    config = RenderConfig(width=32, height=32, extent=(-2.0, 1.0, -1.5, 1.5), max_iter="auto")
+    _, stats = render_mandelbrot(config, return_stats=True)
+    assert stats.max_iter == estimate_max_iter(config.extent)
+    assert "estimate_max_iter" in stats.timings
+
+
+def test_batch_auto_metadata(tmp_path):
+    """Test that batch renders store the resolved max_iter in the image metadata."""
+    manifest = tmp_path / "jobs.jsonl"
+    job = {"width": 32, "height": 32, "extent": [-2.0, 1.0, -1.5, 1.5], "max_iter": "auto", "output": "a.png"}
+    manifest.write_text(json.dumps(job) + "\n")
+    (record,) = run_batch(load_jobs(manifest), tmp_path / "log.jsonl")
+    metadata = read_metadata(tmp_path / "a.png")
+    assert metadata["config"]["max_iter"] == "auto"
+    assert metadata["max_iter"] == record["max_iter"]
+
+
+def test_render_cli_auto_metadata(tmp_path):
+    """Test that the render command stores the estimated max_iter in the image metadata."""
+    from click.testing import CliRunner
+    from mandel_fast.cli import main
+
+    output = tmp_path / "auto.png"
+    result = CliRunner().invoke(main, ["render", "-w", "32", "-h", "32", "-m", "auto", "-o", str(output)])
+    assert result.exit_code == 0, result.output
+    metadata = read_metadata(output)
+    assert metadata["config"]["max_iter"] == "auto"
+    assert metadata["max_iter"] == estimate_max_iter((-2.0, 1.0, -1.5, 1.5))
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+from mandel_fast.render.batch import load_jobs, run_batch
+from mandel_fast.render.render import config_hash, read_metadata
+
+
+def _write_manifest(path, jobs):
+    path.write_text("\n".join(json.dumps(job) for job in jobs) + "\n")
+
+
+@pytest.fixture()
+def manifest(tmp_path):
+    job = {"width": 40, "height": 30, "extent": [-2.0, 1.0, -1.2, 1.2], "max_iter": 50}
+    path = tmp_path / "jobs.jsonl"
+    _write_manifest(
+        path,
+        [
+            dict(job, output="a.png"),
+            dict(job, output="a.png"),
+            dict(job, output="b.png"),
+            dict(job, max_iter=60, output="c.png"),
+        ],
+    )
+    return path
+
+
+def test_run_batch_dedupes_and_skips(manifest, tmp_path):
+    """Test that duplicate jobs are rendered once and finished jobs are skipped."""
+    log = tmp_path / "log.jsonl"
+    jobs = load_jobs(manifest)
+    records = run_batch(jobs, log)
+    assert [r["status"] for r in records] == ["rendered", "duplicate", "copied", "rendered"]
+    assert "compute" in records[0]["timings"]
+    assert read_metadata(tmp_path / "b.png")["hash"] == config_hash(jobs[2].config)
+
+    records = run_batch(load_jobs(manifest), log)
+    assert [r["status"] for r in records] == ["skipped"] * 4
+    assert len(log.read_text().splitlines()) == 8
+
+    # Changing the parameters of an output invalidates it
+    lines = manifest.read_text().splitlines()
+    lines[3] = lines[3].replace('"max_iter": 60', '"max_iter": 70')
+    manifest.write_text("\n".join(lines))
+    records = run_batch(load_jobs(manifest), log)
+    assert [r["status"] for r in records][-1] == "rendered"
+
+
+def test_load_jobs_rejects_unknown_fields(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    _write_manifest(path, [{"width": 4, "height": 4, "extent": [0, 1, 0, 1], "max_iter": 5, "colour": "red"}])
+    with pytest.raises(ValueError, match="colour"):
+        load_jobs(path)
+
+
+def test_load_jobs_rejects_conflicting_outputs(tmp_path):
+    """Test that different jobs writing the same output are rejected."""
+    path = tmp_path / "jobs.jsonl"
+    job = {"width": 4, "height": 4, "extent": [0, 1, 0, 1], "max_iter": 5}
+    _write_manifest(path, [dict(job, output="a.png"), dict(job, output="./a.png")])
+    assert len(load_jobs(path)) == 2
+    _write_manifest(path, [dict(job, output="a.png"), dict(job, max_iter=6, output="sub/../a.png")])
+    with pytest.raises(ValueError, match="line 1"):
+        load_jobs(path)
+
+
+def test_run_batch_other_formats(tmp_path):
+    """Test that duplicates in another format are encoded again and non-PNG outputs are skipped when done."""
+    from PIL import Image
+
+    path = tmp_path / "jobs.jsonl"
+    job = {"width": 20, "height": 20, "extent": [-2.0, 1.0, -1.5, 1.5], "max_iter": 30}
+    _write_manifest(path, [dict(job, output="x.jpg"), dict(job, output="y.png"), dict(job, output="z.jpg")])
+    log = tmp_path / "log.jsonl"
+    records = run_batch(load_jobs(path), log)
+    assert [r["status"] for r in records] == ["rendered", "encoded", "copied"]
+    for name, fmt in [("x.jpg", "JPEG"), ("y.png", "PNG"), ("z.jpg", "JPEG")]:
+        with Image.open(tmp_path / name) as img:
+            assert img.format == fmt
+    assert read_metadata(tmp_path / "z.jpg")["max_iter"] == 30
+
+    records = run_batch(load_jobs(path), log)
+    assert [r["status"] for r in records] == ["skipped"] * 3
+
+
+def test_run_batch_copy_failure_is_per_job(tmp_path):
+    """Test that a duplicate that cannot be encoded fails alone."""
+    path = tmp_path / "jobs.jsonl"
+    job = {"width": 8, "height": 8, "extent": [-2.0, 1.0, -1.5, 1.5], "max_iter": 20}
+    _write_manifest(path, [dict(job, output="x.png"), dict(job, output="y.xyz"), dict(job, output="z.png")])
+    records = run_batch(load_jobs(path), tmp_path / "log.jsonl")
+    assert [r["status"] for r in records] == ["rendered", "failed", "copied"]
+    assert (tmp_path / "z.png").exists()
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "[1, 2]",
+        '{"width": 4, "height": 4, "extent": 1, "max_iter": 5}',
+        '{"width": 4, "height": 4, "extent": [0, 1], "max_iter": 5}',
+        '{"width": 4, "height": 4, "extent": ["a", 1, 0, 1], "max_iter": 5}',
+        '{"width": 4',
+    ],
+)
+def test_load_jobs_malformed_lines(tmp_path, line):
+    """Test that malformed manifest lines raise a ValueError naming the line."""
+    path = tmp_path / "jobs.jsonl"
+    path.write_text('{"width": 4, "height": 4, "extent": [0, 1, 0, 1], "max_iter": 5}\n' + line + "\n")
+    with pytest.raises(ValueError, match=r"jobs\.jsonl:2: "):
+        load_jobs(path)
@@ -0,0 +1,94 @@
+from dataclasses import replace
+
+from mandel_fast.bench import append_history, compare_runs, load_history, run_suite
+
+
+def test_run_suite_history_roundtrip(tmp_path):
+    """Test that benchmark results survive a round trip through the history file."""
+    results = run_suite(
+        workloads=["full", "interior"],
+        engines=["numpy"],
+        threads=[1],
+        max_iters=[20],
+        width=16,
+        height=16,
+        repeats=2,
+        n_resamples=50,
+    )
+    assert len(results) == 2
+    for r in results:
+        assert r.pixels_per_sec.ci_low <= r.pixels_per_sec.ci_high
+        assert r.efficiency is None
+
+    history = tmp_path / "history.json"
+    append_history(history, results)
+    append_history(history, results)
+    runs = load_history(history)
+    assert len(runs) == 2
+    assert runs[-1]["results"] == results
+
+
+def test_compare_runs_detects_regression():
+    """Test that a slower run shows up as a negative change."""
+    baseline = run_suite(
+        workloads=["full"],
+        engines=["numpy"],
+        threads=[1],
+        max_iters=[10],
+        width=8,
+        height=8,
+        repeats=2,
+        n_resamples=10,
+    )
+    current = [
+        replace(r, pixels_per_sec=replace(r.pixels_per_sec, median=r.pixels_per_sec.median / 2))
+        for r in baseline
+    ]
+    (comparison,) = compare_runs(baseline, current)
+    assert abs(comparison.change + 0.5) < 1e-12
+
+
+def test_compare_fails_without_shared_combinations(tmp_path):
+    """Test that --compare fails when the previous run has nothing in common with the current one."""
+    from click.testing import CliRunner
+    from mandel_fast.cli import main
+
+    history = tmp_path / "history.json"
+    args = ["bench", "-W", "full", "-M", "numpy", "-w", "8", "-h", "8", "-r", "2", "-H", str(history)]
+    runner = CliRunner()
+    result = runner.invoke(main, args + ["-m", "10", "--compare"])
+    assert result.exit_code == 0
+    assert "Warning" in result.output
+
+    result = runner.invoke(main, args + ["-m", "20", "--compare"])
+    assert result.exit_code == 1
+    assert "shares no" in result.output
+
+    result = runner.invoke(main, args + ["-m", "10", "--compare", "--threshold", "-0.1"])
+    assert result.exit_code == 2
+
+
+def test_run_suite_schedules():
+    """Test that row schedules are swept once and get their own efficiency baseline."""
+    results = run_suite(
+        workloads=["seahorse"],
+        engines=["rust_parallel"],
+        threads=[1, 2],
+        max_iters=[20],
+        tile_sizes=[8, 16],
+        schedules=["tiles", "rows_unordered"],
+        width=16,
+        height=16,
+        repeats=2,
+        n_resamples=10,
+    )
+    assert [(r.schedule, r.tile_size, r.threads) for r in results] == [
+        ("tiles", 8, 1),
+        ("tiles", 8, 2),
+        ("tiles", 16, 1),
+        ("tiles", 16, 2),
+        ("rows_unordered", None, 1),
+        ("rows_unordered", None, 2),
+    ]
+    assert all((r.efficiency is None) == (r.threads == 1) for r in results)
+    assert len({r.key for r in results}) == len(results)
@@ -0,0 +1,196 @@
+import socket
+import subprocess
+import sys
+import threading
+
+import numpy as np
+import pytest
+from mandel_fast import rs_mandelbrot_parallel
+from mandel_fast.render.distributed import (
+    TileWorkerServer,
+    _recv_message,
+    _send_message,
+    parse_workers,
+    render_distributed,
+)
+
+
+@pytest.fixture(scope="module")
+def workers():
+    """Start three worker processes on localhost and return their addresses."""
+    procs = [
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "from mandel_fast.cli import main; main()",
+                "worker",
+                "--port",
+                "0",
+                "--threads",
+                "1",
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(3)
+    ]
+    try:
+        addresses = [parse_workers(p.stdout.readline().split()[-1])[0] for p in procs]
+        yield addresses
+    finally:
+        for p in procs:
+            p.terminate()
+            p.wait()
+
+
+@pytest.fixture()
+def dead_address():
+    """An address nothing is listening on."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()
+
+
+@pytest.fixture()
+def stalled_address():
+    """An address that accepts connections but never answers."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    conns = []
+    stop = threading.Event()
+
+    def accept():
+        server.settimeout(0.1)
+        while not stop.is_set():
+            try:
+                conns.append(server.accept()[0])
+            except OSError:
+                pass
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    yield server.getsockname()
+    stop.set()
+    thread.join()
+    for conn in conns:
+        conn.close()
+    server.close()
+
+
+@pytest.fixture()
+def wrong_shape_address():
+    """An address of a worker that ignores the region and answers 1x1 tiles."""
+    import socketserver
+    import zlib
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            while (message := _recv_message(self.request)) is not None:
+                job, _ = message
+                payload = zlib.compress(np.zeros(1, dtype="<u2").tobytes())
+                _send_message(self.request, {"id": job["id"], "shape": [1, 1], "dtype": "uint16"}, payload)
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def _render_with_deadline(*args, **kwargs):
+    """Run render_distributed, failing the test instead of hanging."""
+    result = {}
+
+    def run():
+        try:
+            result["image"] = render_distributed(*args, **kwargs)
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=60)
+    assert not thread.is_alive(), "render_distributed hung"
+    if "error" in result:
+        raise result["error"]
+    return result["image"]
+
+
+def test_render_distributed_vs_local(workers):
+    """Test that a distributed render matches a local render pixel for pixel, with exact counts."""
+    width, height, max_iter, extent = 301, 203, 1000, (-2.0, 1.0, -1.2, 1.2)
+    img = render_distributed(width, height, max_iter, extent, workers, tile_size=64)
+    expected = rs_mandelbrot_parallel(width, height, max_iter, *extent, exact=True)
+    assert img.dtype == np.uint16
+    assert img.max() == max_iter
+    np.testing.assert_array_equal(img, expected)
+
+
+def test_render_distributed_reassigns_failed_tiles(workers, dead_address, stalled_address):
+    """Test that tiles of unreachable or stalled workers are rendered by the others."""
+    width, height, max_iter, extent = 200, 150, 100, (-0.76, -0.73, 0.08, 0.11)
+    img = render_distributed(
+        width,
+        height,
+        max_iter,
+        extent,
+        [dead_address, stalled_address, *workers],
+        tile_size=32,
+        timeout=1.0,
+    )
+    expected = rs_mandelbrot_parallel(width, height, max_iter, *extent)
+    np.testing.assert_array_equal(img, expected)
+
+
+def test_render_cli_distributed_stats(workers, tmp_path):
+    """Test that the stats log of a distributed render counts interior pixels like a local render."""
+    import json
+
+    from click.testing import CliRunner
+    from mandel_fast.cli import main
+
+    args = ["render", "-w", "60", "-h", "40", "-m", "1000"]
+    runner = CliRunner()
+    logs = []
+    for name, extra in [("local", []), ("distributed", ["--workers", ",".join(f"{h}:{p}" for h, p in workers)])]:
+        log = tmp_path / f"{name}.json"
+        result = runner.invoke(main, args + ["-o", str(tmp_path / f"{name}.png"), "--stats-log", str(log), *extra])
+        assert result.exit_code == 0, result.output
+        logs.append(json.loads(log.read_text())["stats"])
+    assert logs[1]["interior"] == logs[0]["interior"] > 0
+    assert logs[1]["total_iterations"] == logs[0]["total_iterations"]
+
+
+def test_render_distributed_rejects_wrong_tile_shape(wrong_shape_address):
+    """Test that tiles of the wrong shape are handed to another worker instead of hanging the render."""
+    width, height, max_iter, extent = 64, 48, 50, (-2.0, 1.0, -1.0, 1.0)
+    with pytest.raises(RuntimeError):
+        _render_with_deadline(width, height, max_iter, extent, [wrong_shape_address], tile_size=16)
+
+    with TileWorkerServer(("127.0.0.1", 0), threads=1) as good:
+        threading.Thread(target=good.serve_forever, daemon=True).start()
+        img = _render_with_deadline(
+            width, height, max_iter, extent, [wrong_shape_address, good.server_address], tile_size=16
+        )
+        good.shutdown()
+    expected = rs_mandelbrot_parallel(width, height, max_iter, *extent, exact=True)
+    np.testing.assert_array_equal(img, expected)
+
+
+def test_render_distributed_without_workers(dead_address):
+    """Test that a render fails when no worker is reachable."""
+    with pytest.raises(RuntimeError):
+        render_distributed(10, 10, 10, (-2.0, 1.0, -1.0, 1.0), [dead_address])
+
+
+def test_parse_workers():
+    assert parse_workers("localhost:5555, 10.0.0.2:6000") == [
+        ("localhost", 5555),
+        ("10.0.0.2", 6000),
+    ]
+    with pytest.raises(ValueError):
+        parse_workers("localhost")
@@ -0,0 +1,52 @@
+import numpy as np
+from mandel_fast import RenderStats, rs_mandelbrot, rs_mandelbrot_parallel
+
+
+def _assert_stats_equal(stats, expected):
+    assert stats.total_iterations == expected.total_iterations
+    assert stats.escaped == expected.escaped
+    assert stats.interior == expected.interior
+    np.testing.assert_array_equal(stats.row_iterations, expected.row_iterations)
+
+
+def test_rs_mandelbrot_stats_vs_py(mandelbrot_settings, py_mandelbrot_result):
+    """Test that the Rust statistics match those computed from the Python result."""
+    width, height, max_iter, extent = mandelbrot_settings
+    img, stats = rs_mandelbrot(width, height, max_iter, *extent, return_stats=True)
+    np.testing.assert_array_equal(img, py_mandelbrot_result)
+    _assert_stats_equal(stats, RenderStats.from_counts(py_mandelbrot_result, max_iter))
+    assert len(stats.thread_busy) == 1
+
+
+def test_rs_mandelbrot_parallel_stats_vs_py(mandelbrot_settings, py_mandelbrot_result):
+    """Test that the parallel Rust statistics match those computed from the Python result."""
+    width, height, max_iter, extent = mandelbrot_settings
+    img, stats = rs_mandelbrot_parallel(
+        width, height, max_iter, *extent, threads=2, return_stats=True
+    )
+    np.testing.assert_array_equal(img, py_mandelbrot_result)
+    _assert_stats_equal(stats, RenderStats.from_counts(py_mandelbrot_result, max_iter))
+    assert len(stats.thread_busy) == 2
+    assert stats.pixels == width * height
+
+
+def test_animation_stats_are_opt_in(tmp_path, monkeypatch):
+    """Test that animations without return_stats only ask for stats when they schedule tiles."""
+    from mandel_fast.render import animation
+    from mandel_fast.render.render import RenderConfig
+
+    calls = []
+    render = animation.render_mandelbrot
+
+    def spy(config, return_stats=False, **kwargs):
+        calls.append((config.method, return_stats))
+        return render(config, return_stats=return_stats, **kwargs)
+
+    monkeypatch.setattr(animation, "render_mandelbrot", spy)
+    for method in ["python", "rust_parallel"]:
+        configs = [
+            RenderConfig(width=8, height=8, extent=(-2.0, 1.0, -1.5, 1.5), max_iter=20, method=method),
+            RenderConfig(width=8, height=8, extent=(-1.0, 0.0, -0.5, 0.5), max_iter=20, method=method),
+        ]
+        animation.make_animation(configs, [2], str(tmp_path / f"{method}.gif"))
+    assert calls == [("python", False)] * 3 + [("rust_parallel", True)] * 3
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from mandel_fast import rs_mandelbrot_parallel
+
+
+@pytest.mark.parametrize("tile_size", [1, 7, 64, 1000])
+def test_rs_mandelbrot_parallel_tile_sizes(mandelbrot_settings, py_mandelbrot_result, tile_size):
+    """Test that the tiled parallel implementation matches Python for any tile size."""
+    width, height, max_iter, extent = mandelbrot_settings
+    img, stats = rs_mandelbrot_parallel(
+        width, height, max_iter, *extent, tile_size=tile_size, return_stats=True
+    )
+    np.testing.assert_array_equal(img, py_mandelbrot_result)
+
+    tiles = -(-height // tile_size), -(-width // tile_size)
+    assert stats.tile_iterations.shape == tiles
+    assert stats.tile_iterations.sum() == stats.total_iterations
+
+
+def test_rs_mandelbrot_parallel_cost_hint(mandelbrot_settings, py_mandelbrot_result):
+    """Test that scheduling from a previous frame's tile costs gives the same image."""
+    width, height, max_iter, extent = mandelbrot_settings
+    _, stats = rs_mandelbrot_parallel(
+        width, height, max_iter, *extent, tile_size=32, return_stats=True
+    )
+    img = rs_mandelbrot_parallel(
+        width, height, max_iter, *extent, tile_size=32, cost_hint=stats.tile_iterations
+    )
+    np.testing.assert_array_equal(img, py_mandelbrot_result)
+
+    with pytest.raises(ValueError):
+        rs_mandelbrot_parallel(
+            width, height, max_iter, *extent, tile_size=16, cost_hint=stats.tile_iterations
+        )
+
+
+@pytest.mark.parametrize("schedule", ["tiles", "tiles_unordered", "rows", "rows_unordered"])
+def test_rs_mandelbrot_parallel_schedules(mandelbrot_settings, py_mandelbrot_result, schedule):
+    """Test that every task schedule gives the same image, with one task per row for row schedules."""
+    width, height, max_iter, extent = mandelbrot_settings
+    img, stats = rs_mandelbrot_parallel(
+        width, height, max_iter, *extent, tile_size=32, schedule=schedule, return_stats=True
+    )
+    np.testing.assert_array_equal(img, py_mandelbrot_result)
+    if schedule.startswith("rows"):
+        assert stats.tile_iterations.shape == (height, 1)
+        np.testing.assert_array_equal(stats.tile_iterations[:, 0], stats.row_iterations)
+
+    with pytest.raises(ValueError):
+        rs_mandelbrot_parallel(width, height, max_iter, *extent, schedule="columns")
+
+
+def test_rs_mandelbrot_parallel_exact():
+    """Test that exact=True returns unclamped uint16 counts with the same stats."""
+    from mandel_fast import np_mandelbrot
+
+    width, height, max_iter, extent = 64, 48, 1000, (-0.76, -0.73, 0.08, 0.11)
+    img, stats = rs_mandelbrot_parallel(width, height, max_iter, *extent, exact=True, return_stats=True)
+    assert img.dtype == np.uint16
+    np.testing.assert_array_equal(img, np_mandelbrot(width, height, max_iter, *extent))
+    clamped, clamped_stats = rs_mandelbrot_parallel(width, height, max_iter, *extent, return_stats=True)
+    np.testing.assert_array_equal(clamped, np.minimum(img, 255))
+    assert stats.total_iterations == clamped_stats.total_iterations
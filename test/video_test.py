@@ -0,0 +1,100 @@
+import io
+
+import numpy as np
+import pytest
+from mandel_fast.render.animation import interpolate_configs, make_animation
+from mandel_fast.render.render import RenderConfig, render_mandelbrot
+from mandel_fast.render.video import NpyFrameWriter, Y4MWriter
+
+
+@pytest.fixture()
+def zoom_configs():
+    start = RenderConfig(width=24, height=16, extent=(-2.0, 1.0, -1.0, 1.0), max_iter=50)
+    end = RenderConfig(width=24, height=16, extent=(-0.8, -0.7, 0.05, 0.15), max_iter=80)
+    return [start, end]
+
+
+def test_y4m_stream():
+    """Test that Y4M frames follow the header and map grey RGB to limited range luma."""
+    buf = io.BytesIO()
+    writer = Y4MWriter(buf, width=4, height=2, fps=25)
+    writer.write(np.zeros((2, 4, 3), dtype=np.uint8))
+    writer.write(np.full((2, 4, 3), 255, dtype=np.uint8))
+
+    header, _, body = buf.getvalue().partition(b"\n")
+    assert header == b"YUV4MPEG2 W4 H2 F25:1 Ip A1:1 C444"
+    frames = body.split(b"FRAME\n")[1:]
+    assert [len(f) for f in frames] == [3 * 4 * 2] * 2
+    assert frames[0][:8] == bytes([16] * 8)
+    assert frames[1][:8] == bytes([235] * 8)
+    assert frames[1][8:] == bytes([128] * 16)
+
+    with pytest.raises(ValueError):
+        writer.write(np.zeros((4, 2, 3), dtype=np.uint8))
+
+
+def test_y4m_conversion_in_place():
+    """Test the fixed-point BT.601 conversion and that writing a frame allocates no full-size temporaries."""
+    import tracemalloc
+
+    frame = np.random.default_rng(0).integers(0, 256, (30, 40, 3), dtype=np.uint8)
+    buf = io.BytesIO()
+    writer = Y4MWriter(buf, width=40, height=30)
+    writer.write(frame)
+
+    r, g, b = frame.astype(np.int32).transpose(2, 0, 1)
+    expected = np.stack(
+        [
+            ((66 * r + 129 * g + 25 * b + 128) >> 8) + 16,
+            ((-38 * r - 74 * g + 112 * b + 128) >> 8) + 128,
+            ((112 * r - 94 * g - 18 * b + 128) >> 8) + 128,
+        ]
+    ).astype(np.uint8)
+    assert buf.getvalue()[-expected.size :] == expected.tobytes()
+
+    class Discard(io.RawIOBase):
+        def write(self, data):
+            return len(data)
+
+    frame = np.zeros((300, 400, 3), dtype=np.uint8)
+    writer = Y4MWriter(Discard(), width=400, height=300)
+    writer.write(frame)
+    tracemalloc.start()
+    try:
+        writer.write(frame)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < frame.nbytes // 4
+
+
+def test_npy_animation_matches_frames(zoom_configs, tmp_path):
+    """Test that a streamed .npy animation holds the rendered frames in order, including the way back."""
+    path = tmp_path / "zoom.npy"
+    stats = make_animation(zoom_configs, [3], str(path), reverse=True, return_stats=True)
+
+    stack = np.load(path, mmap_mode="r")
+    expected = interpolate_configs(zoom_configs, [3])
+    expected += expected[-2:0:-1]
+    assert stack.shape == (len(expected), 16, 24, 3)
+    for frame, cfg in zip(stack, expected):
+        np.testing.assert_array_equal(frame, render_mandelbrot(cfg, as_array=True))
+    assert len(stats.frames) == len(expected)
+    assert set(stats.timings) == {"render", "encode"}
+
+
+def test_stream_requires_constant_size(zoom_configs, tmp_path):
+    """Test that streamed animations reject frames of different sizes."""
+    zoom_configs[1].width = 32
+    with pytest.raises(ValueError):
+        make_animation(zoom_configs, [2], str(tmp_path / "zoom.y4m"))
+    with NpyFrameWriter(tmp_path / "one.npy", 1, 24, 16) as writer, pytest.raises(ValueError):
+        writer.write(np.zeros((16, 32, 3), dtype=np.uint8))
+
+
+def test_npy_writer_close_twice(tmp_path):
+    """Test that a frame stack can be closed explicitly inside a with block."""
+    with NpyFrameWriter(tmp_path / "one.npy", 1, 4, 2) as writer:
+        writer.write(np.full((2, 4, 3), 7, dtype=np.uint8))
+        writer.close()
+    assert np.load(tmp_path / "one.npy").max() == 7